@@ -1,31 +1,36 @@
 
 from enum import Enum
-from typing import NamedTuple, Optional
-
-
-class TestInfo(NamedTuple):
-    """Information about an OBD-II Monitor Test ID."""
-    name: str
-    description: str
+from typing import Optional
 
 
 TEST_IDS = {
-    # <TID>: TestInfo(name, description)
+    # <TID>: (name, description)
     # 0x0 is reserved
-    0x01: TestInfo("RTL_THRESHOLD_VOLTAGE", "Rich to lean sensor threshold voltage"),
-    0x02: TestInfo("LTR_THRESHOLD_VOLTAGE", "Lean to rich sensor threshold voltage"),
-    0x03: TestInfo("LOW_VOLTAGE_SWITCH_TIME", "Low sensor voltage for switch time calculation"),
-    0x04: TestInfo("HIGH_VOLTAGE_SWITCH_TIME", "High sensor voltage for switch time calculation"),
-    0x05: TestInfo("RTL_SWITCH_TIME", "Rich to lean sensor switch time"),
-    0x06: TestInfo("LTR_SWITCH_TIME", "Lean to rich sensor switch time"),
-    0x07: TestInfo("MIN_VOLTAGE", "Minimum sensor voltage for test cycle"),
-    0x08: TestInfo("MAX_VOLTAGE", "Maximum sensor voltage for test cycle"),
-    0x09: TestInfo("TRANSITION_TIME", "Time between sensor transitions"),
-    0x0A: TestInfo("SENSOR_PERIOD", "Sensor period"),
-    0x0B: TestInfo("MISFIRE_AVERAGE", "Average misfire counts for last ten driving cycles"),
-    0x0C: TestInfo("MISFIRE_COUNT", "Misfire counts for last/current driving cycles"),
+    0x01: ("RTL_THRESHOLD_VOLTAGE", "Rich to lean sensor threshold voltage"),
+    0x02: ("LTR_THRESHOLD_VOLTAGE", "Lean to rich sensor threshold voltage"),
+    0x03: ("LOW_VOLTAGE_SWITCH_TIME", "Low sensor voltage for switch time calculation"),
+    0x04: ("HIGH_VOLTAGE_SWITCH_TIME", "High sensor voltage for switch time calculation"),
+    0x05: ("RTL_SWITCH_TIME", "Rich to lean sensor switch time"),
+    0x06: ("LTR_SWITCH_TIME", "Lean to rich sensor switch time"),
+    0x07: ("MIN_VOLTAGE", "Minimum sensor voltage for test cycle"),
+    0x08: ("MAX_VOLTAGE", "Maximum sensor voltage for test cycle"),
+    0x09: ("TRANSITION_TIME", "Time between sensor transitions"),
+    0x0A: ("SENSOR_PERIOD", "Sensor period"),
+    0x0B: ("MISFIRE_AVERAGE", "Average misfire counts for last ten driving cycles"),
+    0x0C: ("MISFIRE_COUNT", "Misfire counts for last/current driving cycles"),
 }
 
+# TEST_IDS flattened into tables indexed directly by the (one byte) TID.
+# Reserved and manufacturer TIDs read as "Unknown".
+_names = ["Unknown"] * 256
+_descs = ["Unknown"] * 256
+for _tid, (_name, _desc) in TEST_IDS.items():
+    _names[_tid] = _name
+    _descs[_tid] = _desc
+TEST_NAMES = tuple(_names)
+TEST_DESCS = tuple(_descs)
+del _names, _descs, _tid, _name, _desc
+
 
 # Base tests (always present for all vehicle types)
 BASE_TESTS = [
@@ -58,22 +63,28 @@ COMPRESSION_TESTS = [
     "EGR_VVT_SYSTEM_MONITORING",
 ]
 
-FUEL_STATUS = [
+# The status bits are read MSB first, so the decoder walks these lists
+# back to front. Reverse them once here rather than on every decode.
+BASE_TESTS_REV = tuple(reversed(BASE_TESTS))
+SPARK_TESTS_REV = tuple(reversed(SPARK_TESTS))
+COMPRESSION_TESTS_REV = tuple(reversed(COMPRESSION_TESTS))
+
+FUEL_STATUS = (
     "Open loop due to insufficient engine temperature",
     "Closed loop, using oxygen sensor feedback to determine fuel mix",
     "Open loop due to engine load OR fuel cut due to deceleration",
     "Open loop due to system failure",
     "Closed loop, using at least one oxygen sensor but there is a fault in the feedback system",
-]
+)
 
-AIR_STATUS = [
+AIR_STATUS = (
     "Upstream",
     "Downstream of catalytic converter",
     "From the outside atmosphere or off",
     "Pump commanded on for diagnostics",
-]
+)
 
-OBD_COMPLIANCE = [
+OBD_COMPLIANCE = (
     "Undefined",
     "OBD-II as defined by the CARB",
     "OBD as defined by the EPA",
@@ -108,14 +119,14 @@ OBD_COMPLIANCE = [
     "India OBD I (IOBD I)",
     "India OBD II (IOBD II)",
     "Heavy Duty Euro OBD Stage VI (HD EOBD-IV)",
-]
+)
 
 IGNITION_TYPE = [
     "spark",       # Gas
     "compression", # Diesel
 ]
 
-FUEL_TYPES = [
+FUEL_TYPES = (
     "Not available",
     "Gasoline",
     "Methanol",
@@ -140,4 +151,4 @@ FUEL_TYPES = [
     "Hybrid running electric and combustion engine",
     "Hybrid Regenerative",
     "Bifuel running diesel",
-]
\ No newline at end of file
+)
\ No newline at end of file
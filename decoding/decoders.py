@@ -7,11 +7,14 @@ lists of DTCs, and more.
 """
 
 import functools
-from typing import List, Tuple, Optional, Callable, Any
+from typing import List, Tuple, Optional, Callable, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 from obd2.utils.bit_array import BitArray
-from obd2.utils.hex_tools import bytes_to_int, bytes_to_hex, twos_comp
-from decoding.codes import TEST_IDS, BASE_TESTS, SPARK_TESTS, COMPRESSION_TESTS, FUEL_STATUS, AIR_STATUS, OBD_COMPLIANCE, FUEL_TYPES, IGNITION_TYPE
+from obd2.utils.hex_tools import bytes_to_hex, twos_comp
+from decoding.codes import TEST_NAMES, TEST_DESCS, BASE_TESTS_REV, SPARK_TESTS_REV, COMPRESSION_TESTS_REV, FUEL_STATUS, AIR_STATUS, OBD_COMPLIANCE, FUEL_TYPES, IGNITION_TYPE
 from decoding.dtc_codes import DTC
 from decoding.diagnostic_types import Status, StatusTest, Monitor, MonitorTest
 from obd2.utils.units_and_scaling import Unit, UAS_IDS
@@ -38,6 +41,11 @@ Messages are protocol-specific message objects with attributes:
 '''
 
 
+def _payload(messages: List[Message]) -> memoryview:
+    """Data of the first message without the mode and PID bytes, without copying"""
+    return memoryview(messages[0].data)[2:]
+
+
 # drop all messages, return None
 def drop(_: Any) -> None:
     """Drop all messages and return None"""
@@ -53,7 +61,7 @@ def noop(messages: List[Message]) -> bytearray:
 # hex in, bitstring out
 def pid(messages: List[Message]) -> BitArray:
     """Convert message data to BitArray, skipping mode/PID bytes"""
-    d = messages[0].data[2:]
+    d = _payload(messages)
     return BitArray(d)
 
 
@@ -77,213 +85,305 @@ def uas(id_: int) -> Callable[[List[Message], int], Quantity]:
 
 def decode_uas(messages: List[Message], id_: int) -> Quantity:
     """Decode using Units and Scaling table"""
-    d = messages[0].data[2:]  # chop off mode and PID bytes
+    d = _payload(messages)  # chop off mode and PID bytes
     return UAS_IDS[id_](d)
 
 
 """
 General sensor decoders
 Return pint Quantities
+
+The scaling for the simple linear decoders lives in small helpers that work
+on either a plain int or a NumPy array, so the single-message decoders and
+decode_batch() share one formula.
 """
 
+# Look the units up once: attribute access on the registry re-parses the
+# name every time, and building the Quantity directly skips pint's __mul__.
+_Q = Unit.Quantity
+_COUNT = Unit.count
+_PERCENT = Unit.percent
+_CELSIUS = Unit.celsius
+_MILLIAMPERE = Unit.milliampere
+_VOLT = Unit.volt
+_KILOPASCAL = Unit.kilopascal
+_PASCAL = Unit.pascal
+_DEGREE = Unit.degree
+_GPS = Unit.gps
+_LITERS_PER_HOUR = Unit.liters_per_hour
+
+
+def _percent(v):
+    return v * 100.0 / 255.0
+
+
+def _percent_centered(v):
+    return (v - 128) * 100.0 / 128.0
+
+
+def _temp(v):
+    return v - 40
+
+
+def _sensor_voltage(v):
+    return v / 200.0
+
+
+def _sensor_voltage_big(v):
+    return (v * 8.0) / 65535
+
+
+def _fuel_pressure(v):
+    return v * 3
+
+
+def _timing_advance(v):
+    return (v - 128) / 2.0
+
+
+def _decode_batch(fn: Callable[['np.ndarray'], 'np.ndarray'],
+                  messages: List[Message],
+                  slice_: Tuple[int, int] = (2, 3)) -> 'np.ndarray':
+    """
+    Apply a scaling function to the same byte range of many messages at once.
+
+    The bytes in data[start:stop] of each message are read as one big-endian
+    unsigned integer, giving a 1-D float array that fn scales in a single
+    vectorized expression.
+    """
+    # only batch decoding needs NumPy, so don't load it with the module
+    import numpy as np
+
+    start, stop = slice_
+    width = stop - start
+    raw = b"".join(bytes(m.data[start:stop]) for m in messages)
+    arr = np.frombuffer(raw, dtype=np.uint8).reshape(-1, width).astype(np.float64)
+    if width == 1:
+        values = arr[:, 0]
+    else:
+        values = arr @ (256.0 ** np.arange(width - 1, -1, -1))
+    return fn(values)
+
+
 def count(messages: List[Message]) -> Quantity:
     """Raw count value"""
-    d = messages[0].data[2:]
-    v = bytes_to_int(d)
-    return v * Unit.count
+    d = _payload(messages)
+    v = int.from_bytes(d, "big")
+    return _Q(v, _COUNT)
 
 # 0 to 100 %
 def percent(messages: List[Message]) -> Quantity:
     """Percentage (0-100%)"""
-    d = messages[0].data[2:]
-    v = d[0]
-    v = v * 100.0 / 255.0
-    return v * Unit.percent
+    d = _payload(messages)
+    v = _percent(d[0])
+    return _Q(v, _PERCENT)
 
 
 # -100 to 100 %
 def percent_centered(messages: List[Message]) -> Quantity:
     """Centered percentage (-100 to 100%)"""
-    d = messages[0].data[2:]
-    v = d[0]
-    v = (v - 128) * 100.0 / 128.0
-    return v * Unit.percent
+    d = _payload(messages)
+    v = _percent_centered(d[0])
+    return _Q(v, _PERCENT)
 
 
 # -40 to 215 C
 def temp(messages: List[Message]) -> Quantity:
     """Temperature in Celsius (-40 to 215°C)"""
-    d = messages[0].data[2:]
-    v = bytes_to_int(d)
-    v = v - 40
-    return Unit.Quantity(v, Unit.celsius)  # non-multiplicative unit
+    d = _payload(messages)
+    v = _temp(int.from_bytes(d, "big"))
+    return _Q(v, _CELSIUS)  # non-multiplicative unit
 
 
 # -128 to 128 mA
 def current_centered(messages: List[Message]) -> Quantity:
     """Centered current in milliamperes (-128 to 128 mA)"""
-    d = messages[0].data[2:]
-    v = bytes_to_int(d[2:4])
+    d = _payload(messages)
+    v = int.from_bytes(d[2:4], "big")
     v = (v / 256.0) - 128
-    return v * Unit.milliampere
+    return _Q(v, _MILLIAMPERE)
 
 
 # 0 to 1.275 volts
 def sensor_voltage(messages: List[Message]) -> Quantity:
     """Sensor voltage (0 to 1.275V)"""
-    d = messages[0].data[2:]
-    v = d[0] / 200.0
-    return v * Unit.volt
+    d = _payload(messages)
+    v = _sensor_voltage(d[0])
+    return _Q(v, _VOLT)
 
 
 # 0 to 8 volts
 def sensor_voltage_big(messages: List[Message]) -> Quantity:
     """Sensor voltage, wide range (0 to 8V)"""
-    d = messages[0].data[2:]
-    v = bytes_to_int(d[2:4])
-    v = (v * 8.0) / 65535
-    return v * Unit.volt
+    d = _payload(messages)
+    v = _sensor_voltage_big(int.from_bytes(d[2:4], "big"))
+    return _Q(v, _VOLT)
 
 
 # 0 to 765 kPa
 def fuel_pressure(messages: List[Message]) -> Quantity:
     """Fuel pressure (0 to 765 kPa)"""
-    d = messages[0].data[2:]
-    v = d[0]
-    v = v * 3
-    return v * Unit.kilopascal
+    d = _payload(messages)
+    v = _fuel_pressure(d[0])
+    return _Q(v, _KILOPASCAL)
 
 
 # 0 to 255 kPa
 def pressure(messages: List[Message]) -> Quantity:
     """Pressure (0 to 255 kPa)"""
-    d = messages[0].data[2:]
+    d = _payload(messages)
     v = d[0]
-    return v * Unit.kilopascal
+    return _Q(v, _KILOPASCAL)
 
 
 # -8192 to 8192 Pa
 def evap_pressure(messages: List[Message]) -> Quantity:
     """Evaporative system pressure (-8192 to 8192 Pa)"""
     # decode the twos complement
-    d = messages[0].data[2:]
+    d = _payload(messages)
     a = twos_comp(d[0], 8)
     b = twos_comp(d[1], 8)
     v = ((a * 256.0) + b) / 4.0
-    return v * Unit.pascal
+    return _Q(v, _PASCAL)
 
 
 # 0 to 327.675 kPa
 def abs_evap_pressure(messages: List[Message]) -> Quantity:
     """Absolute evap pressure (0 to 327.675 kPa)"""
-    d = messages[0].data[2:]
-    v = bytes_to_int(d)
+    d = _payload(messages)
+    v = int.from_bytes(d, "big")
     v = v / 200.0
-    return v * Unit.kilopascal
+    return _Q(v, _KILOPASCAL)
 
 
 # -32767 to 32768 Pa
 def evap_pressure_alt(messages: List[Message]) -> Quantity:
     """Alternative evap pressure format (-32767 to 32768 Pa)"""
-    d = messages[0].data[2:]
-    v = bytes_to_int(d)
+    d = _payload(messages)
+    v = int.from_bytes(d, "big")
     v = v - 32767
-    return v * Unit.pascal
+    return _Q(v, _PASCAL)
 
 
 # -64 to 63.5 degrees
 def timing_advance(messages: List[Message]) -> Quantity:
     """Ignition timing advance (-64 to 63.5°)"""
-    d = messages[0].data[2:]
-    v = d[0]
-    v = (v - 128) / 2.0
-    return v * Unit.degree
+    d = _payload(messages)
+    v = _timing_advance(d[0])
+    return _Q(v, _DEGREE)
 
 
 # -210 to 301 degrees
 def inject_timing(messages: List[Message]) -> Quantity:
     """Fuel injection timing (-210 to 301°)"""
-    d = messages[0].data[2:]
-    v = bytes_to_int(d)
+    d = _payload(messages)
+    v = int.from_bytes(d, "big")
     v = (v - 26880) / 128.0
-    return v * Unit.degree
+    return _Q(v, _DEGREE)
 
 
 # 0 to 2550 grams/sec
 def max_maf(messages: List[Message]) -> Quantity:
     """Maximum mass air flow (0 to 2550 g/s)"""
-    d = messages[0].data[2:]
+    d = _payload(messages)
     v = d[0]
     v = v * 10
-    return v * Unit.gps
+    return _Q(v, _GPS)
 
 
 # 0 to 3212 Liters/hour
 def fuel_rate(messages: List[Message]) -> Quantity:
     """Fuel consumption rate (0 to 3212 L/h)"""
-    d = messages[0].data[2:]
-    v = bytes_to_int(d)
+    d = _payload(messages)
+    v = int.from_bytes(d, "big")
     v = v * 0.05
-    return v * Unit.liters_per_hour
+    return _Q(v, _LITERS_PER_HOUR)
+
+
+# presence flags for every value of a 4 or 2 bit O2 sensor bank, MSB first
+_O2_BANK_4 = tuple(tuple(bool((n >> (3 - i)) & 1) for i in range(4)) for n in range(16))
+_O2_BANK_2 = tuple(tuple(bool((n >> (1 - i)) & 1) for i in range(2)) for n in range(4))
 
 
 # special bit encoding for PID 13
 def o2_sensors(messages: List[Message]) -> Tuple[Tuple, Tuple[bool, ...], Tuple[bool, ...]]:
     """O2 sensor locations - returns (invalid, bank1, bank2)"""
-    d = messages[0].data[2:]
-    bits = BitArray(d)
+    b = _payload(messages)[0]
     return (
         (),  # bank 0 is invalid
-        tuple(bits[:4]),  # bank 1
-        tuple(bits[4:]),  # bank 2
+        _O2_BANK_4[b >> 4],  # bank 1
+        _O2_BANK_4[b & 0xF],  # bank 2
     )
 
 
 def aux_input_status(messages: List[Message]) -> bool:
     """Auxiliary input status (PTO status)"""
-    d = messages[0].data[2:]
+    d = _payload(messages)
     return ((d[0] >> 7) & 1) == 1  # first bit indicate PTO status
 
 
 # special bit encoding for PID 1D
 def o2_sensors_alt(messages: List[Message]) -> Tuple[Tuple, Tuple[bool, ...], Tuple[bool, ...], Tuple[bool, ...], Tuple[bool, ...]]:
     """Alternative O2 sensor locations - returns (invalid, bank1, bank2, bank3, bank4)"""
-    d = messages[0].data[2:]
-    bits = BitArray(d)
+    b = _payload(messages)[0]
     return (
         (),  # bank 0 is invalid
-        tuple(bits[:2]),  # bank 1
-        tuple(bits[2:4]),  # bank 2
-        tuple(bits[4:6]),  # bank 3
-        tuple(bits[6:]),  # bank 4
+        _O2_BANK_2[b >> 6],  # bank 1
+        _O2_BANK_2[(b >> 4) & 3],  # bank 2
+        _O2_BANK_2[(b >> 2) & 3],  # bank 3
+        _O2_BANK_2[b & 3],  # bank 4
     )
 
 
 # 0 to 25700 %
 def absolute_load(messages: List[Message]) -> Quantity:
     """Absolute load value (0 to 25700%)"""
-    d = messages[0].data[2:]
-    v = bytes_to_int(d)
-    v *= 100.0 / 255.0
-    return v * Unit.percent
+    d = _payload(messages)
+    v = _percent(int.from_bytes(d, "big"))
+    return _Q(v, _PERCENT)
 
 
 def elm_voltage(messages: List[Message]) -> Optional[Quantity]:
     """ELM327 adapter voltage"""
     # doesn't register as a normal OBD response,
     # so access the raw frame data
-    v = messages[0].frames[0].raw
     # Some ELMs provide float V (for example messages[0].frames[0].raw => u'12.3V'
-    v = v.lower()
-    v = v.replace('v', '')
+    v = messages[0].frames[0].raw.rstrip("vV \t\r\n")
 
     try:
-        return float(v) * Unit.volt
+        return _Q(float(v), _VOLT)
     except ValueError:
         logger.warning("Failed to parse ELM voltage")
         return None
 
 
+# decoder -> (scaling function, data slice, unit) for decode_batch()
+_BATCH_DECODERS = {
+    percent:            (_percent,            (2, 3), _PERCENT),
+    percent_centered:   (_percent_centered,   (2, 3), _PERCENT),
+    temp:               (_temp,               (2, 3), _CELSIUS),
+    sensor_voltage:     (_sensor_voltage,     (2, 3), _VOLT),
+    sensor_voltage_big: (_sensor_voltage_big, (4, 6), _VOLT),
+    fuel_pressure:      (_fuel_pressure,      (2, 3), _KILOPASCAL),
+    timing_advance:     (_timing_advance,     (2, 3), _DEGREE),
+    absolute_load:      (_percent,            (2, 4), _PERCENT),
+}
+
+
+def decode_batch(decoder: Callable[[List[Message]], Quantity], messages: List[Message]) -> Quantity:
+    """
+    Decode one response per message with a single vectorized pass.
+
+    Useful for log replay, where many responses to the same command need
+    decoding. Returns a Quantity wrapping a NumPy array with one element
+    per message.
+    """
+    if decoder not in _BATCH_DECODERS:
+        raise ValueError(f"{getattr(decoder, '__name__', decoder)} has no batch decoder")
+    fn, slice_, unit = _BATCH_DECODERS[decoder]
+    return _Q(_decode_batch(fn, messages, slice_), unit)
+
+
 '''
 Special decoders
 Return objects, lists, etc
@@ -291,8 +391,8 @@ Return objects, lists, etc
 
 
 def status(messages: List[Message]) -> Status:
-    d = messages[0].data[2:]
-    bits = BitArray(d)
+    d = _payload(messages)
+    word = int.from_bytes(d[:4], "big")
 
     #            ┌Components not ready
     #            |┌Fuel not ready
@@ -304,57 +404,58 @@ def status(messages: List[Message]) -> Status:
     #  |         |||||||
     #  10000011 00000111 11111111 00000000
     #   [# DTC] X        [supprt] [~ready]
+    #
+    # bit n of the diagram (MSB first) is (word >> (31 - n)) & 1
 
     output = Status()
-    output.MIL = bits[0]
-    output.DTC_count = bits.value(1, 8)
-    output.ignition_type = IGNITION_TYPE[int(bits[12])]
+    output.MIL = bool(word >> 31)
+    output.DTC_count = (word >> 24) & 0x7F
+    compression = (word >> 19) & 1
+    output.ignition_type = IGNITION_TYPE[compression]
 
     # load the 3 base tests that are always present
-    for i, name in enumerate(BASE_TESTS[::-1]):
-        t = StatusTest(name, bits[13 + i], not bits[9 + i])
-        output.__dict__[name] = t
+    for i, name in enumerate(BASE_TESTS_REV):
+        t = StatusTest(name, bool((word >> (18 - i)) & 1),
+                       not (word >> (22 - i)) & 1)
+        setattr(output, name, t)
 
     # different tests for different ignition types
-    if bits[12]:  # compression
-        for i, name in enumerate(COMPRESSION_TESTS[::-1]):  # reverse to correct for bit vs. indexing order
-            t = StatusTest(name, bits[(2 * 8) + i],
-                           not bits[(3 * 8) + i])
-            output.__dict__[name] = t
-
-    else:  # spark
-        for i, name in enumerate(SPARK_TESTS[::-1]):  # reverse to correct for bit vs. indexing order
-            t = StatusTest(name, bits[(2 * 8) + i],
-                           not bits[(3 * 8) + i])
-            output.__dict__[name] = t
+    # reversed to correct for bit vs. indexing order
+    tests = COMPRESSION_TESTS_REV if compression else SPARK_TESTS_REV
+    for i, name in enumerate(tests):
+        if name is None:  # reserved bit
+            continue
+        t = StatusTest(name, bool((word >> (15 - i)) & 1),
+                       not (word >> (7 - i)) & 1)
+        setattr(output, name, t)
 
     return output
 
 
+def _single_bit_index(b: int) -> int:
+    """Position of the only set bit in b, or -1 if zero or several bits are set"""
+    if b and not b & (b - 1):
+        return b.bit_length() - 1
+    return -1
+
+
 def fuel_status(messages: List[Message]) -> Optional[Tuple[str, str]]:
     """Fuel system status - returns tuple of (status1, status2) or None"""
-    d = messages[0].data[2:]
-    bits = BitArray(d)
+    d = _payload(messages)
 
-    status_1 = ""
-    status_2 = ""
-
-    if bits[0:8].count(True) == 1:
-        if 7 - bits[0:8].index(True) < len(FUEL_STATUS):
-            status_1 = FUEL_STATUS[7 - bits[0:8].index(True)]
-        else:
-            logger.debug("Invalid response for fuel status (high bits set)")
-    else:
-        logger.debug("Invalid response for fuel status (multiple/no bits set)")
+    statuses = ["", ""]
 
-    if bits[8:16].count(True) == 1:
-        if 7 - bits[8:16].index(True) < len(FUEL_STATUS):
-            status_2 = FUEL_STATUS[7 - bits[8:16].index(True)]
+    for i, b in enumerate(d[:2]):
+        # exactly one bit may be set
+        bit = _single_bit_index(b)
+        if bit < 0:
+            logger.debug("Invalid response for fuel status (multiple/no bits set)")
+        elif bit < len(FUEL_STATUS):
+            statuses[i] = FUEL_STATUS[bit]
         else:
             logger.debug("Invalid response for fuel status (high bits set)")
-    else:
-        logger.debug("Invalid response for fuel status (multiple/no bits set)")
 
+    status_1, status_2 = statuses
     if not status_1 and not status_2:
         return None
     else:
@@ -363,21 +464,23 @@ def fuel_status(messages: List[Message]) -> Optional[Tuple[str, str]]:
 
 def air_status(messages: List[Message]) -> Optional[str]:
     """Secondary air status"""
-    d = messages[0].data[2:]
-    bits = BitArray(d)
+    d = _payload(messages)
 
     status = None
-    if bits.num_set() == 1:
-        status = AIR_STATUS[7 - bits[0:8].index(True)]
+    bit = _single_bit_index(d[0])
+    if bit < 0 or any(d[1:]):
+        logger.debug("Invalid response for air status (multiple/no bits set)")
+    elif bit < len(AIR_STATUS):
+        status = AIR_STATUS[bit]
     else:
-        logger.debug("Invalid response for fuel status (multiple/no bits set)")
+        logger.debug("Invalid response for air status (high bits set)")
 
     return status
 
 
 def obd_compliance(messages: List[Message]) -> Optional[str]:
     """OBD compliance standard"""
-    d = messages[0].data[2:]
+    d = _payload(messages)
     i = d[0]
 
     v = None
@@ -392,7 +495,7 @@ def obd_compliance(messages: List[Message]) -> Optional[str]:
 
 def fuel_type(messages: List[Message]) -> Optional[str]:
     """Fuel type"""
-    d = messages[0].data[2:]
+    d = _payload(messages)
     i = d[0]  # todo, support second fuel system
 
     v = None
@@ -405,11 +508,19 @@ def fuel_type(messages: List[Message]) -> Optional[str]:
     return v
 
 
+# for building DTC strings in parse_dtc()
+_DTC_PREFIX = "PCBU"
+_DTC_FMT = "{}{}{:03X}".format
+
+
 def parse_dtc(_bytes: List[int]) -> Optional[Tuple[str, str]]:
     """Converts 2 bytes into a DTC code tuple (code, description)"""
 
     # check validity (also ignores padding that the ELM returns)
-    if (len(_bytes) != 2) or (_bytes == (0, 0)):
+    if len(_bytes) != 2:
+        return None
+    b0, b1 = _bytes
+    if not b0 and not b1:
         return None
 
     # BYTES: (16,      35      )
@@ -419,70 +530,70 @@ def parse_dtc(_bytes: List[int]) -> Optional[Tuple[str, str]]:
     #         | / /
     # DTC:    C0123
 
-    dtc = ['P', 'C', 'B', 'U'][_bytes[0] >> 6]  # the last 2 bits of the first byte
-    dtc += str((_bytes[0] >> 4) & 0b0011)  # the next pair of 2 bits. Mask off the bits we read above
-    dtc += bytes_to_hex(_bytes)[1:4]
+    # the last 2 bits of the first byte, the next pair of 2 bits,
+    # then the remaining 12 bits in hex
+    dtc = _DTC_FMT(_DTC_PREFIX[b0 >> 6], (b0 >> 4) & 0b0011, ((b0 & 0xF) << 8) | b1)
 
     # pull a description if we have one
-    try:
-        return (dtc, DTC[dtc].value)
-    except KeyError:
-        return (dtc, "")
+    return (dtc, _dtc_description(dtc))
+
 
+def _dtc_description(code: str) -> str:
+    """Look up the description of a DTC, or "" if it isn't in the table"""
+    member = DTC.__members__.get(code)
+    return member.value if member is not None else ""
 
-def hex_to_int(str: str) -> int:
+
+def hex_to_int(s: str) -> int:
     """Convert hex string to integer"""
-    i = eval("0x" + str, {}, {})
-    return i
+    return int(s, 16)
 
 def single_dtc(messages: List[Message]) -> Optional[Tuple[str, str]]:
     """Parse a single DTC from a message"""
-    d = messages[0].data[2:]
+    d = _payload(messages)
     return parse_dtc(d)
 
 
 def dtc(messages: List[Message]) -> List[Tuple[str, str]]:
     """Converts a frame of 2-byte DTCs into a list of (code, description) tuples"""
-    codes = []
-    d = []
-    print("len messages == ",len(messages))
+    d = bytearray()
     for message in messages:
-        print("len data == ", len(message.data))
-        #  # remove the mode and DTC_count bytes
+        # remove the mode and DTC_count bytes
         if message.can == False:
             d += message.data[2:]
         elif message.can and message.num_frames == 1:
             d += message.data[1:]  # remove the mode and DTC_count bytes
         elif message.can and message.num_frames > 1:
             d += message.data[0:]  # remove the mode and DTC_count bytes
-    print(d)
-    print(len(d))
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("DTC data from %d messages: %s", len(messages), bytes_to_hex(d))
+
+    # the common case: no codes stored, only padding
+    if not d.strip(b'\x00'):
+        return []
 
     # look at data in pairs of bytes
     # looping through ENDING indices to avoid odd (invalid) code lengths
+    codes = []
     for n in range(1, len(d), 2):
-        # parse the code
-        dtc = parse_dtc([d[n-1],d[n]])
-        if (dtc is not None) and (dtc[0] != "P0000"):
-            print(dtc)
+        # parse the code, parse_dtc() skips the all-zero padding
+        dtc = parse_dtc((d[n - 1], d[n]))
+        if dtc is not None:
             codes.append(dtc)
 
     return codes
 
 
-def parse_monitor_test(d: bytearray, mon: Monitor) -> Optional[MonitorTest]:
+def parse_monitor_test(d: bytearray) -> Optional[MonitorTest]:
     """Parse a 9-byte monitor test result"""
     test = MonitorTest()
 
     tid = d[1]
-
-    if tid in TEST_IDS:
-        test.name = TEST_IDS[tid][0]  # lookup the name from the table
-        test.desc = TEST_IDS[tid][1]  # lookup the description from the table
-    else:
+    test.name = TEST_NAMES[tid]  # lookup the name from the table
+    test.desc = TEST_DESCS[tid]  # lookup the description from the table
+    if test.name == "Unknown":
         logger.debug("Encountered unknown Test ID")
-        test.name = "Unknown"
-        test.desc = "Unknown"
 
     uas = UAS_IDS.get(d[2], None)
 
@@ -495,7 +606,7 @@ def parse_monitor_test(d: bytearray, mon: Monitor) -> Optional[MonitorTest]:
     test.tid = tid
     test.value = uas(d[3:5])  # convert bytes to actual values
     test.min = uas(d[5:7])
-    test.max = uas(d[7:])
+    test.max = uas(d[7:9])
 
     return test
 
@@ -519,13 +630,17 @@ def monitor(messages: List[Message]) -> Monitor:
     # look at data in blocks of 9 bytes (one test result)
     for n in range(0, len(d), 9):
         # extract the 9 byte block, and parse a new MonitorTest
-        test = parse_monitor_test(d[n:n + 9], mon)
+        test = parse_monitor_test(d[n:n + 9])
         if test is not None:
             mon.add_test(test)
 
     return mon
 
 
+# padding and whitespace the ELM leaves around encoded strings
+_ENC_STRIP = b'\x00\x01\x02 \t\r\n'
+
+
 def encoded_string(length: int) -> Callable[[List[Any], int], Optional[bytes]]:
     """Extract an encoded string from multi-part messages"""
     return functools.partial(decode_encoded_string, length=length)
@@ -536,13 +651,13 @@ def decode_encoded_string(messages: List[Message], length: int) -> Optional[byte
     d = messages[0].data[2:]
 
     if len(d) < length:
-        logger.debug("Invalid string {}. Discarding...", d)
+        logger.debug("Invalid string %s. Discarding...", d)
         return None
 
     # Encoded strings come in bundles of messages with leading null values to
     # pad out the string to the next full message size. We strip off the
     # leading null characters here and return the resulting string.
-    return d.strip().strip(b'\x00' b'\x01' b'\x02' b'\\x00' b'\\x01' b'\\x02')
+    return d.strip(_ENC_STRIP) or None
 
 
 def cvn(messages: List[Message]) -> Optional[str]:
@@ -6,7 +6,15 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+# every named readiness test, without the reserved (None) bits or duplicates
+_STATUS_TESTS = tuple(dict.fromkeys(
+    name for name in BASE_TESTS + SPARK_TESTS + COMPRESSION_TESTS if name
+))
+
+
 class Status:
+    __slots__ = ("MIL", "DTC_count", "ignition_type") + _STATUS_TESTS
+
     def __init__(self):
         self.MIL = False
         self.DTC_count = 0
@@ -16,9 +24,8 @@ class Status:
         # until real data comes it. This also prevents things from
         # breaking when the user looks up a standard test that's null.
         null_test = StatusTest()
-        for name in BASE_TESTS + SPARK_TESTS + COMPRESSION_TESTS:
-            if name:  # filter out None/reserved tests
-                self.__dict__[name] = null_test
+        for name in _STATUS_TESTS:
+            setattr(self, name, null_test)
 
 
 class StatusTest():
@@ -35,6 +35,18 @@ from obd2.utils.obd_status import OBDStatus
 
 logger = logging.getLogger(__name__)
 
+# replies to 0100 showing that the protocol being tried can't reach the car
+_PROTOCOL_ERRORS = re.compile("|".join(map(re.escape, [
+    "UNABLE TO CONNECT",
+    "NO DATA",
+    "BUS INIT: ...ERROR",
+    "CAN ERROR",
+])))
+
+# placeholder until a protocol is found. It never learns any ECUs, so one
+# instance can be shared by every adapter
+_UNKNOWN_PROTOCOL = UnknownProtocol([])
+
 
 class ELM327:
     """
@@ -51,10 +63,28 @@ class ELM327:
             ecus()
     """
 
+    # fixed per-connection state, no instance __dict__
+    __slots__ = (
+        "__portname",
+        "__baudrate",
+        "__protocol_id",
+        "__check_voltage",
+        "__start_low_power",
+        "__status",
+        "__protocol",
+        "__low_power_mode",
+        "__timeout",
+        "__port",
+        "__detected_baudrate",
+        "__unsupported_baudrates",
+    )
+
     # chevron (ELM prompt character)
     ELM_PROMPT = b'>'
     # an 'OK' which indicates we are entering low power state
     ELM_LP_ACTIVE = b'OK'
+    # longest wait for the prompt after a wake-up space (seconds)
+    _WAKE_TIMEOUT = 1.0
 
     _SUPPORTED_PROTOCOLS = {
         # "0" : None,
@@ -89,6 +119,14 @@ class ELM327:
         "A",  # SAE_J1939
     ]
 
+    # ATDPN reply -> protocol ID. An "A" prefix means the ELM picked the
+    # protocol automatically; a lone "A" is protocol A itself
+    _DPN_PROTOCOLS = {p: p for p in _SUPPORTED_PROTOCOLS}
+    _DPN_PROTOCOLS.update({"A" + p: p for p in _SUPPORTED_PROTOCOLS})
+
+    # "try protocol" command for each supported protocol, encoded once
+    _ATTP_COMMANDS = {p: b"ATTP" + p.encode() for p in _SUPPORTED_PROTOCOLS}
+
     # 38400, 9600 are the possible boot bauds (unless reprogrammed via
     # PP 0C).  19200, 38400, 57600, 115200, 230400, 500000 are listed on
     # p.46 of the ELM327 datasheet.
@@ -99,7 +137,9 @@ class ELM327:
     # We check the two default baud rates first, then go fastest to
     # slowest, on the theory that anyone who's using a slow baud rate is
     # going to be less picky about the time required to detect it.
-    _TRY_BAUDS = [38400, 9600,  115200, 57600, 19200, 14400, 3000000, 2000000, 1000000, 250000, 230400, 128000, 500000, 460800, 500000, 576000, 921600, 1000000, 1152000, 1500000, 2000000, 2500000, 3000000, 3500000, 4000000]
+    #
+    # Each rate appears once; every probe costs a read timeout.
+    _TRY_BAUDS = [38400, 9600, 115200, 57600, 19200, 14400, 3000000, 2000000, 1000000, 250000, 230400, 128000, 500000, 460800, 576000, 921600, 1152000, 1500000, 2500000, 3500000, 4000000]
 
     def __init__(self, 
                  portname: str, 
@@ -110,9 +150,7 @@ class ELM327:
                  start_low_power: bool = False
                  ) -> None:
         """Initializes port by resetting device and getting supported PIDs."""
-        log_msg = f"Initializing ELM327: PORT={portname} BAUD={baudrate} PROTOCOL={protocol}"
-        logger.info(log_msg)
-        print(log_msg)
+        logger.info("Initializing ELM327: PORT=%s BAUD=%s PROTOCOL=%s", portname, baudrate, protocol)
         
         # Save connection parameters for reconnection
         self.__portname = portname
@@ -123,10 +161,12 @@ class ELM327:
         
         # Initialize instance variables
         self.__status = OBDStatus.NOT_CONNECTED
-        self.__protocol = UnknownProtocol([])
+        self.__protocol = _UNKNOWN_PROTOCOL
         self.__low_power_mode = False
         self.__timeout = timeout
         self.__port = None
+        self.__detected_baudrate = None
+        self.__unsupported_baudrates = set()
         
         # Perform initial connection
         self._connect(portname, baudrate, protocol, check_voltage, start_low_power)
@@ -171,10 +211,9 @@ class ELM327:
         # Set baudrate
         if not self.set_baudrate(baudrate):
             logger.error("Failed to set baudrate")
-            print("Failed to set baudrate")
             self.__cleanup_failed_connection()
             return False
-        print(f"Baudrate set to {baudrate}")
+        logger.debug("Baudrate set to %s", baudrate)
 
         # Reset device (ATZ)
         if not self.__reset_device():
@@ -196,7 +235,7 @@ class ELM327:
 
         # Successfully communicated with ELM
         self.__status = OBDStatus.ELM_CONNECTED
-        print('Connected to the ELM327')
+        logger.info("Connected to the ELM327")
         
         # Check voltage if requested
         if check_voltage:
@@ -205,22 +244,20 @@ class ELM327:
                 logger.warning("Voltage check failed, but ELM is connected")
                 return False
             self.__status = OBDStatus.OBD_CONNECTED
-            print('OBD Connected')
+            logger.info("OBD Connected")
         
         # Try to communicate with the car
         if not self.set_protocol(protocol):
             err_msg = "Failed to set protocol. "
             err_msg += "Adapter is connected, but failed to connect to the vehicle, ignition may be off."
             logger.error(err_msg)
-            print(err_msg)
             # Keep ELM_CONNECTED status - adapter works, just can't reach vehicle
             return False
         
         # Success!
         self.__status = OBDStatus.CAR_CONNECTED
-        log_msg = f"Connected Successfully: PORT={portname} BAUD={self.__port.baudrate} PROTOCOL={self.__protocol.ELM_ID}"
-        logger.info(log_msg)
-        print(log_msg)
+        logger.info("Connected Successfully: PORT=%s BAUD=%s PROTOCOL=%s",
+                    portname, self.__port.baudrate, self.__protocol.ELM_ID)
         return True
 
     def is_connected(self) -> bool:
@@ -230,21 +267,18 @@ class ELM327:
         try:
             return self.__port.is_open
         except serial.SerialException:
-            logging.error("Serial exception when checking port status")
+            logger.error("Serial exception when checking port status")
             return False
 
     def set_protocol(self, protocol_) -> bool:
         if not self.is_connected():
             err_msg = "Cannot set_protocol() when unconnected"
             logger.error(err_msg)
-            print(err_msg)
             return False
         if protocol_ is not None:
             # an explicit protocol was specified
             if protocol_ not in self._SUPPORTED_PROTOCOLS:
-                err_msg = f"{protocol_} is not a valid protocol. Please use \"1\" through \"A\""
-                logger.error(err_msg)
-                print(err_msg)
+                logger.error("%s is not a valid protocol. Please use \"1\" through \"A\"", protocol_)
                 return False
             return self.manual_protocol(protocol_)
         else:
@@ -252,16 +286,16 @@ class ELM327:
             return self.auto_protocol()
 
     def manual_protocol(self, protocol_):
-        r = self.__send(b"ATTP" + protocol_.encode())
+        r = self.__send(self._ATTP_COMMANDS[protocol_])
         r0100 = self.__send(b"0100")
 
         if not self.__has_message(r0100, "UNABLE TO CONNECT"):
             # success, found the protocol
             self.__protocol = self._SUPPORTED_PROTOCOLS[protocol_](r0100)
-            print('Protocol set.')
+            logger.debug("Protocol set")
             return True
         else:
-            print('Failed to set protocol.')
+            logger.debug("Failed to set protocol")
         return False
 
     def auto_protocol(self):
@@ -275,28 +309,24 @@ class ELM327:
         """
 
         # -------------- try the ELM's auto protocol mode --------------
-        r = self.__send(b"ATSP0", delay=1)
-        print('Trying to set auto protocol.')
+        r = self.__send(b"ATSP0")
+        logger.debug("Trying to set auto protocol")
         # -------------- 0100 (first command, SEARCH protocols) --------------
         r0100 = self.__send(b"0100", delay=1)
         if self.__has_message(r0100, "UNABLE TO CONNECT"):
             logger.error("Failed to query protocol 0100: unable to connect")
-            print("Failed to query protocol 0100: unable to connect")
             # return False  -- Try one by one !!
 
         # ------------------- ATDPN (list protocol number) -------------------
         r = self.__send(b"ATDPN")
         if len(r) != 1:
             logger.error("Failed to retrieve current protocol")
-            print("Failed to retrieve current protocol")
             # return False  -- Try one by one !!
 
-        p = r[0]  # grab the first (and only) line returned
-        # suppress any "automatic" prefix
-        p = p[1:] if (len(p) > 1 and p.startswith("A")) else p
-
+        # grab the first (and only) line returned, and
         # check if the protocol is something we know
-        if p in self._SUPPORTED_PROTOCOLS:
+        p = self._DPN_PROTOCOLS.get(r[0]) if r else None
+        if p is not None:
             # jackpot, instantiate the corresponding protocol handler
             self.__protocol = self._SUPPORTED_PROTOCOLS[p](r0100)
             return True
@@ -305,22 +335,17 @@ class ELM327:
             # this is likely because not all adapter/car combinations work
             # in "auto" mode. Some respond to ATDPN responded with "0"
             logger.debug("ELM responded with unknown protocol. Trying them one-by-one")
-            print("ELM responded with unknown protocol. Trying them one-by-one")
             for p in self._TRY_PROTOCOL_ORDER:
-                r = self.__send(b"ATTP" + p.encode())
+                r = self.__send(self._ATTP_COMMANDS[p])
                 r0100 = self.__send(b"0100")
-                if not self.__has_message(r0100, "UNABLE TO CONNECT") and \
-                    not self.__has_message(r0100, "NO DATA") and \
-                    not self.__has_message(r0100, "BUS INIT: ...ERROR") and \
-                    not self.__has_message(r0100, "CAN ERROR"):
+                if not self.__has_protocol_error(r0100):
                     # success, found the protocol
-                    print('success, found the protocol')
+                    logger.debug("Found protocol %s", p)
                     self.__protocol = self._SUPPORTED_PROTOCOLS[p](r0100)
                     return True
 
         # if we've come this far, then we have failed...
         logger.error("Failed to determine protocol")
-        print("Failed to determine protocol")
         return False
 
     def set_baudrate(self, baud_rate: int = None, psuedo_baud_rate: int = 38400) -> int | None:
@@ -337,7 +362,6 @@ class ELM327:
             # when connecting to pseudo terminal, don't bother with auto baud
             if self.port_name.startswith("/dev/pts"):
                 logger.debug("Detected pseudo terminal, skipping baudrate setup")
-                print("Detected pseudo terminal, skipping baudrate setup")
                 self.__port.baudrate = psuedo_baud_rate
                 return psuedo_baud_rate
             else:
@@ -345,10 +369,10 @@ class ELM327:
         else:
             try:
                 self.__port.baudrate = baud_rate
-                print(f"Baud rate set to {baud_rate}")
+                logger.debug("Baud rate set to %d", baud_rate)
                 return baud_rate
             except serial.SerialException:
-                print("Baud rate not supported!")
+                logger.error("Baud rate %d not supported", baud_rate)
                 return None
 
     def auto_detect_baudrate(self) -> int | None:
@@ -356,23 +380,31 @@ class ELM327:
         Detect the baud rate at which a connected ELM32x interface is operating.
         
         Returns the detected baud rate on success, or None on failure.
+
+        The rate found last time is tried first, since a reconnect is
+        almost always to the same adapter, and rates the serial port
+        refused before are not tried again.
         """
-        return detect_elm327_baudrate(self.__port)
+        baud = detect_elm327_baudrate(self.__port,
+                                      first_try=self.__detected_baudrate,
+                                      unsupported=self.__unsupported_baudrates)
+        if baud is not None:
+            self.__detected_baudrate = baud
+        return baud
  
     def __reset_device(self) -> bool:
         try:
             response = self.__send(b"ATZ", delay=1)  # wait 1 second for ELM to initialize
-            if "ELM" in str(response).upper():
-                print(str(response))
-                print("ATZ successful")
+            # look for the "ELM327 v1.x" banner, in any case
+            if any("ELM" in line.upper() for line in response):
+                logger.debug("ATZ successful: %s", response)
                 return True
             else:
-                print('ELM not found on this port.')
+                logger.error("ELM not found on this port")
                 return False
             # return data can be junk, so don't bother checking
         except serial.SerialException as e:
             self.__error(e)
-            print(e)
             return False
 
     def __disable_linefeeds(self) -> bool:    
@@ -382,11 +414,11 @@ class ELM327:
             self.__error("ATL0 did not return 'OK'")
             return False
         else:
-            print('ATL0 OK')
+            logger.debug("ATL0 OK")
             return True
         
     def __disable_echo(self) -> bool:
-        response = self.__send(b"ATE0", delay=1)
+        response = self.__send(b"ATE0")
         if not self.__isok(response, expectEcho=True):
             self.__error("ATE0 did not return 'OK'")
             return False
@@ -395,7 +427,7 @@ class ELM327:
             return True
 
     def __enable_headers(self) -> bool:
-        response = self.__send(b"ATH1", delay=1)
+        response = self.__send(b"ATH1")
         if not self.__isok(response):
             self.__error("ATH1 did not return 'OK', or echoing is still ON")
             return False
@@ -413,29 +445,23 @@ class ELM327:
             logger.error("No response from 'AT RV'")
             return None
         try:
-            response_volts = float(response[0].lower().replace('v', ''))
-            return response_volts
-        except ValueError as e:
-            self.__error(f"Incorrect response from 'AT RV' {response_volts}")
+            # the ELM answers like "12.3V"
+            return float(response[0].rstrip("vV "))
+        except ValueError:
+            self.__error(f"Incorrect response from 'AT RV' {response[0]}")
             return None
     
-    def __is_vehicle_voltage_correct(self, voltage: float) -> bool:
+    def __is_vehicle_voltage_correct(self) -> bool:
         """ Check if the vehicle voltage is within acceptable range """
-        try:
-            voltage = float(self.check_voltage())
-        except (TypeError, ValueError):
-            voltage = None
+        voltage = self.check_voltage()  # a float, or None if unreadable
         if voltage is None:
             logger.error("Failed to read vehicle voltage")
-            print("Failed to read vehicle voltage")
             return False
         elif voltage < 6.0:
-            logger.error("Vehicle voltage too low: %.2f V" % voltage)
-            print("Vehicle voltage too low: %.2f V" % voltage)
+            logger.error("Vehicle voltage too low: %.2f V", voltage)
             return False
         elif voltage > 16.0:
-            logger.error("Vehicle voltage too high: %.2f V" % voltage)
-            print("Vehicle voltage too high: %.2f V" % voltage)
+            logger.error("Vehicle voltage too high: %.2f V", voltage)
             return False
         return True
 
@@ -443,17 +469,20 @@ class ELM327:
         if not lines:
             return False
         if expectEcho:
-            # don't test for the echo itself
-            # allow the adapter to already have echo disabled
-            return self.__has_message(lines, 'OK')
+            # don't test for the echo itself, it always comes before the
+            # reply; allow the adapter to already have echo disabled
+            return lines[-1] == 'OK'
         else:
-            return len(lines) == 1 and lines[0] == 'OK'
+            return lines == ['OK']
 
     def __has_message(self, lines, text):
-        for line in lines:
-            if text in line:
-                return True
-        return False
+        # one substring search over the whole reply; text never holds a
+        # newline, so a match can't straddle two lines
+        return text in "\n".join(lines)
+
+    def __has_protocol_error(self, lines):
+        """ True if any line carries one of the _PROTOCOL_ERRORS replies """
+        return _PROTOCOL_ERRORS.search("\n".join(lines)) is not None
 
     def __cleanup_failed_connection(self):
         """
@@ -465,13 +494,12 @@ class ELM327:
             try:
                 self.__port.close()
             except Exception as e:
-                logger.debug(f"Exception while closing port during cleanup: {e}")
+                logger.debug("Exception while closing port during cleanup: %s", e)
             self.__port = None
 
     def __error(self, msg):
         """ handles fatal failures, logs error info and closes serial """
         logger.error(str(msg))
-        print(str(msg))
         self.__cleanup_failed_connection()
     
     @property
@@ -548,18 +576,15 @@ class ELM327:
         if not self.is_connected():
             err_msg = "Cannot enter low power when unconnected"
             logger.info(err_msg)
-            print(err_msg)
             return None
 
         lines = self.__send(b"ATLP", delay=1, end_marker=self.ELM_LP_ACTIVE)
 
         if 'OK' in lines:
             logger.debug("Successfully entered low power mode")
-            print("Successfully entered low power mode")
             self.__low_power_mode = True
         else:
             logger.debug("Failed to enter low power mode")
-            print("Failed to enter low power mode")
 
         return lines
 
@@ -581,14 +606,12 @@ class ELM327:
         if not self.is_connected():
             err_msg = "Cannot exit low power when unconnected"
             logger.info(err_msg)
-            print(err_msg)
             return None
 
         lines = self.__send(b" ")
 
         # Assume we woke up
         logger.debug("Successfully exited low power mode")
-        print("Successfully exited low power mode")
         self.__low_power_mode = False
 
         return lines
@@ -600,7 +623,6 @@ class ELM327:
         """
         if self.__port is not None:
             logger.info("closing port")
-            print("closing port")
             try:
                 self.__port.write_timeout = 0.1
                 self.__write(b"ATZ")
@@ -632,8 +654,7 @@ class ELM327:
         Returns:
             True if reconnection successful, False otherwise
         """
-        logger.info(f"Attempting to reconnect (max {max_attempts} attempts)...")
-        print(f"Attempting to reconnect (max {max_attempts} attempts)...")
+        logger.info("Attempting to reconnect (max %d attempts)...", max_attempts)
         
         # Use saved connection parameters
         portname = self.__portname
@@ -645,12 +666,10 @@ class ELM327:
         # If we don't have the original parameters, can't reconnect
         if not portname:
             logger.error("Cannot reconnect: original port name not available")
-            print("Cannot reconnect: original port name not available")
             return False
         
         for attempt in range(1, max_attempts + 1):
-            logger.info(f"Reconnection attempt {attempt}/{max_attempts}")
-            print(f"Reconnection attempt {attempt}/{max_attempts}")
+            logger.info("Reconnection attempt %d/%d", attempt, max_attempts)
             
             try:
                 # Close existing connection cleanly
@@ -662,21 +681,17 @@ class ELM327:
                 
                 # Use the _connect() method to re-establish connection
                 if self._connect(portname, baudrate, protocol, check_voltage, start_low_power):
-                    logger.info(f"Reconnection successful on attempt {attempt}")
-                    print(f"Reconnection successful on attempt {attempt}")
+                    logger.info("Reconnection successful on attempt %d", attempt)
                     return True
                 else:
-                    logger.warning(f"Attempt {attempt}: Connection failed")
-                    print(f"Attempt {attempt}: Connection failed")
+                    logger.warning("Attempt %d: Connection failed", attempt)
                     
             except Exception as e:
-                logger.warning(f"Attempt {attempt}: Exception during reconnect: {e}")
-                print(f"Attempt {attempt}: Exception during reconnect: {e}")
+                logger.warning("Attempt %d: Exception during reconnect: %s", attempt, e)
                 continue
         
         # All attempts failed
-        logger.error(f"Reconnection failed after {max_attempts} attempts")
-        print(f"Reconnection failed after {max_attempts} attempts")
+        logger.error("Reconnection failed after %d attempts", max_attempts)
         self.__cleanup_failed_connection()
         return False
 
@@ -708,17 +723,14 @@ class ELM327:
         
     #     # Connection lost - try to reconnect
     #     logger.info("Connection lost during send, attempting reconnect...")
-    #     print("Connection lost during send, attempting reconnect...")
         
     #     if self.reconnect(max_attempts=max_reconnect_attempts):
     #         # Reconnection successful, retry the command
     #         logger.info("Reconnected successfully, retrying command...")
-    #         print("Reconnected successfully, retrying command...")
     #         return self.send_and_parse(cmd)
     #     else:
     #         # Reconnection failed
     #         logger.error("Reconnection failed, cannot send command")
-    #         print("Reconnection failed, cannot send command")
     #         return None
 
     def send_and_parse(self, cmd):
@@ -735,7 +747,6 @@ class ELM327:
         if not self.is_connected():
             err_msg = "Cannot send_and_parse() when unconnected"
             logger.error(err_msg)
-            print(err_msg)
             return None
 
         # Check if we are in low power
@@ -757,22 +768,13 @@ class ELM327:
         """
         self.__write(cmd)
 
-        delayed = 0.0
         if delay is not None:
-            logger.debug("wait: %d seconds" % delay)
-            print("wait: %d seconds" % delay)
+            logger.debug("wait: %d seconds", delay)
             time.sleep(delay)
-            delayed += delay
-
-        r = self.__read(end_marker=end_marker)
-        while delayed < 1.0 and len(r) <= 0:
-            d = 0.1
-            logger.debug("no response; wait: %f seconds" % d)
-            print("no response; wait: %f seconds" % d)
-            time.sleep(d)
-            delayed += d
-            r = self.__read(end_marker=end_marker)
-        return r
+
+        # __read() blocks until the end marker or the port timeout, so
+        # there is nothing to gain from reading again
+        return self.__read(end_marker=end_marker)
 
     def __write(self, cmd):
         """
@@ -781,20 +783,19 @@ class ELM327:
 
         if self.__port:
             cmd += b"\r"  # terminate with carriage return in accordance with ELM327 and STN11XX specifications
-            logger.debug("write: " + repr(cmd))
-            print("write: " + repr(cmd))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("write: %r", cmd)
             try:
-                self.__port.flushInput()  # dump everything in the input buffer
+                self.__port.reset_input_buffer()  # dump everything in the input buffer
                 self.__port.write(cmd)  # turn the string into bytes and write
-                self.__port.flush()  # wait for the output buffer to finish transmitting
+                # no flush(): __read() waits for the reply, which can't come
+                # before the command has gone out anyway
             except Exception as e:
-                logger.critical(f"Device disconnected while writing: {e}")
-                print(f"Device disconnected while writing: {e}")
+                logger.critical("Device disconnected while writing: %s", e)
                 self.__cleanup_failed_connection()
                 return
         else:
             logger.info("cannot perform __write() when unconnected")
-            print("cannot perform __write() when unconnected")
 
     def __read(self, end_marker=ELM_PROMPT):
         """
@@ -806,49 +807,54 @@ class ELM327:
         """
         if not self.__port:
             logger.info("cannot perform __read() when unconnected")
-            print("cannot perform __read() when unconnected")
             return []
 
         buffer = bytearray()
+        search_from = 0  # only bytes after this could hold the marker
+        # looked up once, not on every pass of the loop
+        port = self.__port
+        read = port.read
+        extend = buffer.extend
+        find = buffer.find
+        marker_tail = len(end_marker) - 1
 
         while True:
             # retrieve as much data as possible
             try:
-                data = self.__port.read(self.__port.in_waiting or 1)
+                data = read(port.in_waiting or 1)
             except Exception as e:
-                logger.critical(f"Device disconnected while reading: {e}")
-                print(f"Device disconnected while reading: {e}")
+                logger.critical("Device disconnected while reading: %s", e)
                 self.__cleanup_failed_connection()
                 return []
 
             # if nothing was received
             if not data:
                 logger.warning("Failed to read port")
-                print("Failed to read port")
                 self.__cleanup_failed_connection()
                 break
 
-            buffer.extend(data)
+            extend(data)
 
-            # end on specified end-marker sequence
-            if end_marker in buffer:
+            # end on specified end-marker sequence. The marker may straddle
+            # two reads, so back up by its length less one byte
+            if find(end_marker, search_from) != -1:
                 break
+            search_from = max(len(buffer) - marker_tail, 0)
 
         # log, and remove the "bytearray(   ...   )" part
-        logger.debug("read: " + repr(buffer)[10:-1])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("read: %s", repr(buffer)[10:-1])
 
         # clean out any null characters
-        buffer = re.sub(b"\x00", b"", buffer)
+        buffer = buffer.replace(b"\x00", b"")
 
         # remove the prompt character
-        if buffer.endswith(self.ELM_PROMPT):
-            buffer = buffer[:-1]
+        if buffer[-1:] == self.ELM_PROMPT:
+            del buffer[-1]  # in place, no copy of the reply
 
-        # convert bytes into a standard string
-        string = buffer.decode("utf-8", "ignore")
-
-        # splits into lines while removing empty lines and trailing spaces
-        lines = [s.strip() for s in re.split("[\r\n]", string) if bool(s)]
+        # splits into lines while removing empty lines and trailing spaces,
+        # converting only the lines we keep into standard strings
+        lines = [s.decode("ascii", "ignore").strip() for s in buffer.splitlines() if s]
 
         return lines
     
@@ -868,40 +874,70 @@ class ELM327:
                                                 stopbits=1,
                                                 bytesize=8,
                                                 timeout=10)  # Use a long timeout for opening the port, but use the set timeout for reads
-            print(f"Port {portname} created")
+            logger.debug("Port %s created", portname)
             port.write_timeout = timeout
+            self.__set_low_latency(port)
             return port
         except serial.SerialException as e:
-            logger.error(f"Failed to open serial port: {e}")
-            print(f"Failed to open serial port: {e}")
+            logger.error("Failed to open serial port: %s", e)
             return None
         except OSError as e:
-            logger.error(f"OS error opening serial port: {e}")
-            print(f"OS error opening serial port: {e}")
+            logger.error("OS error opening serial port: %s", e)
             return None
-        
+
+    @staticmethod
+    def __set_low_latency(port) -> None:
+        """
+        Ask the serial driver to hand over received bytes right away.
+
+        USB-serial bridges (FTDI and friends) otherwise hold incoming data
+        for up to 16 ms, which is paid on every command round trip. Only
+        Linux serial ports support this; everything else keeps its defaults.
+        """
+        try:
+            port.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, OSError, ValueError) as e:
+            logger.debug("Low latency mode not available: %s", e)
+
     def __wake_from_low_power(self):
         """
         Wakes the ELM327 from Low Power mode
 
-        Send a space to trigger the RS232 to wakeup.
+        Send a space to trigger the RS232 to wakeup, then wait until the
+        adapter shows its prompt, or for a second at most.
         """
         if self.__port:
             self.__write(b" ")
-            time.sleep(1)
-            print("Start low power")
+            # the adapter may still be sending its reset output while it
+            # wakes, and would drop a command written before the prompt
+            port = self.__port
+            if port is not None:
+                timeout = port.timeout
+                try:
+                    port.timeout = self._WAKE_TIMEOUT
+                    port.read_until(self.ELM_PROMPT)
+                except (serial.SerialException, OSError) as e:
+                    logger.debug("Error while waiting for wake-up prompt: %s", e)
+                finally:
+                    port.timeout = timeout
+            logger.debug("Woke adapter from low power")
         else:
             log_msg = "Cannot wake from low power when unconnected"
             logger.info(log_msg)
-            print(log_msg)
 
 
-def detect_elm327_baudrate(port: serial.Serial) -> int | None:
+def detect_elm327_baudrate(port: serial.Serial,
+                           first_try: int | None = None,
+                           unsupported: set[int] | None = None) -> int | None:
     """
     Detect the baud rate at which a connected ELM32x interface is operating.
 
     Args:
         port: An opened serial port object.
+        first_try: A baud rate to probe before the others, e.g. the one
+            detected last time.
+        unsupported: Baud rates the serial port refused earlier. These are
+            skipped, and rates refused now are added to it.
     Returns:
         The detected baud rate on success, or None on failure.
     """
@@ -910,48 +946,50 @@ def detect_elm327_baudrate(port: serial.Serial) -> int | None:
     port.timeout = 0.1  # we're only talking with the ELM, so things should go quickly
     port.write_timeout = 0.1
 
+    try_bauds = ELM327._TRY_BAUDS
+    if first_try is not None:
+        try_bauds = [first_try] + [b for b in try_bauds if b != first_try]
+
     found_baud = False
-    for baud in ELM327._TRY_BAUDS:
-        print(f"Trying baudrate {baud}...")
-        if _test_baudrate(port, baud):
+    for baud in try_bauds:
+        if unsupported is not None and baud in unsupported:
+            continue
+        logger.debug("Trying baudrate %d...", baud)
+        if _test_baudrate(port, baud, unsupported):
             found_baud = True
             break
 
     if not found_baud:
         log_msg = "Failed to find baud rate"
         logger.debug(log_msg)
-        print(log_msg)
     else:
-        log_msg = f"Detected baud rate: {baud}"
-        logger.debug(log_msg)
-        print(log_msg)
+        logger.debug("Detected baud rate: %d", baud)
 
     log_msg = "Reinstating original timeout"
     logger.debug(log_msg)
-    print(log_msg)
     try:
         port.timeout = timeout  # reinstate our original timeout
         port.write_timeout = timeout
     except serial.SerialException:
         log_msg = "Failed to reinstate original timeout"
         logger.debug(log_msg)
-        print(log_msg)
         return None
     if found_baud:
         return baud
     else:
         log_msg = "Failed to find baud"
         logger.debug(log_msg)
-        print(log_msg)
         return None
 
-def _test_baudrate(port: serial.Serial, baud_rate: int) -> bool:
+def _test_baudrate(port: serial.Serial, baud_rate: int, unsupported: set[int] | None = None) -> bool:
     """
     Test if the given baud rate is supported by the ELM327 interface.
 
     Args:
         port: An opened serial port object.
         baud_rate: The baud rate to test.
+        unsupported: If given, the baud rate is added to it when the
+            serial port refuses it.
     Returns:
         True if the baud rate is supported, False otherwise.
     """
@@ -959,41 +997,53 @@ def _test_baudrate(port: serial.Serial, baud_rate: int) -> bool:
     try:
         port.baudrate = baud_rate
     except serial.SerialException:
-        log_msg = f"Baudrate {baud_rate} not supported by serial port."
-        logger.debug(log_msg)
-        print(log_msg)
+        logger.debug("Baudrate %d not supported by serial port.", baud_rate)
+        if unsupported is not None:
+            unsupported.add(baud_rate)
         return False
 
-    port.flush()
+    # drop whatever came in at the previous baud rate
+    port.reset_input_buffer()
 
     try:
         port.write(b"\x7F\x7F\r")
     except serial.SerialTimeoutException:
         log_msg = "Port write timeout"
         logger.debug(log_msg)
-        print(log_msg)
         return False
 
-    port.flush()
     try:
-        response = port.read(1024)
+        response = _read_probe_reply(port)
     except serial.SerialTimeoutException:
         log_msg = "Port read timeout"
         logger.debug(log_msg)
-        print(log_msg)
         return False
 
-    log_msg = f"Response from baud {baud_rate}: {repr(response)}"
-    logger.debug(log_msg)
-    print(log_msg)
+    logger.debug("Response from baud %d: %r", baud_rate, response)
 
-    if "ELM" in str(response).upper() or ((b'\x7f\x7f\r' in response) and (response.endswith(b">"))):
-        log_msg = f"Baudrate {baud_rate} returned valid response"
-        logger.debug(log_msg)
-        print(log_msg)
+    if b"ELM" in response.upper() or ((b'\x7f\x7f\r' in response) and (response.endswith(b">"))):
+        logger.debug("Baudrate %d returned valid response", baud_rate)
         return True
     else:
-        log_msg = f"Baudrate {baud_rate} did not return valid response"
-        logger.debug(log_msg)
-        print(log_msg)
+        logger.debug("Baudrate %d did not return valid response", baud_rate)
         return False
+
+
+def _read_probe_reply(port: serial.Serial, max_size: int = 1024) -> bytes:
+    """
+    Read the reply to a baud rate probe.
+
+    Stops as soon as the prompt arrives instead of waiting out the read
+    timeout, so a working baud rate is confirmed in a few character times.
+    A wrong baud rate still ends on the timeout (an empty read), or once
+    max_size bytes of noise have come in.
+    """
+    response = bytearray()
+    while len(response) < max_size:
+        data = port.read(min(port.in_waiting or 1, max_size - len(response)))
+        if not data:
+            break
+        response.extend(data)
+        if response.endswith(b">"):
+            break
+    return bytes(response)
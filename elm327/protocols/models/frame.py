@@ -1,7 +1,7 @@
 
 from dataclasses import dataclass, field
 
-@dataclass
+@dataclass(slots=True)
 class Frame:
     """ Represents a single OBD-II frame/message line. """
 
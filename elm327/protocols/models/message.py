@@ -6,12 +6,12 @@ from ecu.ecu import ECU
 
 from elm327.protocols.models.frame import Frame
 
-@dataclass
+@dataclass(slots=True)
 class Message(object):
     """ represents a fully parsed OBD message of one or more Frames (lines) """
 
     frames: list[Frame]
-    ecu = ECU.UNKNOWN
+    ecu: ECU = ECU.UNKNOWN
     num_frames: int = 0
     data: bytearray = field(default_factory=bytearray)
     can: bool = False
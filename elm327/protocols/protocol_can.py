@@ -101,7 +101,6 @@ class CANProtocol(Protocol):
                               self.FRAME_TYPE_CF,
                               self.FRAME_TYPE_FC]:
             logger.debug("Dropping frame carrying unknown PCI frame type")
-            print("Dropping frame carrying unknown PCI frame type")
             return False
 
         if frame.type == self.FRAME_TYPE_SF:
@@ -141,16 +140,14 @@ class CANProtocol(Protocol):
     def parse_message(self, message: Message):
 
         frames = message.frames
-        print("How many frames? ", len(frames))
+        logger.debug("Parsing message of %d frame(s)", len(frames))
         message.num_frames = len(frames)
         message.can = True
         if (len(frames) >= 1) and (frames[0].type == self.FRAME_TYPE_SF):
             if len(frames) == 1:
                 frame = frames[0]
-                print("Frame type: ", frame.type)
                 if frame.type != self.FRAME_TYPE_SF:
                     logger.debug("Recieved lone frame not marked as single frame")
-                    print("Recieved lone frame not marked as single frame")
                     return False
 
                 # extract data, ignore PCI byte and anything after the marked length
@@ -162,12 +159,9 @@ class CANProtocol(Protocol):
 
 
             elif len(frames) > 1:
-                print("I AM HERE! DTC multiple frames!")
-                for frame in frames:
-                    print("Frame: " , frame.data)
-                    message.data += frame.data[2:8]
+                logger.debug("Joining %d single frames (DTC reply)", len(frames))
+                message.data += b"".join(frame.data[2:8] for frame in frames)
                 #message.data =message.data.rstrip(b'\x00\x00\x00\x00')
-                print ("Message data: ", message.data)
 
 
         else:
@@ -177,13 +171,11 @@ class CANProtocol(Protocol):
             cf = []
             for f in frames:
 
-                print("Frame type: ", f.type)
                 if f.type == self.FRAME_TYPE_FF:
                     ff.append(f)
                 elif f.type == self.FRAME_TYPE_CF:
                     cf.append(f)
                 else:
-                    print("Dropping frame in multi-frame response not marked as FF or CF")
                     logger.debug("Dropping frame in multi-frame response not marked as FF or CF")
 
             # check that we captured only one first-frame
@@ -239,15 +231,13 @@ class CANProtocol(Protocol):
             # [     specified message length (from first-frame)      ]
             # 49 04 01 35 36 30 32 38 39 34 39 41 43 00 00 00 00 00 00 31
 
-            # on the first frame, skip PCI byte AND length code
-            message.data = ff[0].data[2:]
-
-            # now that they're in order, load/accumulate the data from each CF frame
-            for f in cf:
-                message.data += f.data[1:]  # chop off the PCI byte
+            # on the first frame, skip PCI byte AND length code, then
+            # now that they're in order, append the data from each CF frame
+            # in a single join (chopping off their PCI byte)
+            message.data = ff[0].data[2:] + b"".join(f.data[1:] for f in cf)
 
             # chop to the correct size (as specified in the first frame)
-            message.data = message.data[:ff[0].data_len]
+            del message.data[ff[0].data_len:]
 
         # trim DTC requests based on DTC count
         # this ISN'T in the decoder because the legacy protocols
@@ -58,7 +58,7 @@ class LegacyProtocol(Protocol):
 
         # test that all frames are responses to the same Mode (SID)
         if len(frames) > 1:
-            if not all([mode == f.data[0] for f in frames[1:]]):
+            if not all(mode == f.data[0] for f in frames[1:]):
                 logger.debug("Recieved frames from multiple commands")
                 return False
 
@@ -83,9 +83,8 @@ class LegacyProtocol(Protocol):
             # 48 6B 10 43 03 04 00 00 00 00 ck
             #             [     Data      ]
 
-            message.data = bytearray([0x43, 0x00])  # forge the mode byte and CAN's DTC_count byte
-            for f in frames:
-                message.data += f.data[1:]
+            # forge the mode byte and CAN's DTC_count byte
+            message.data = bytearray([0x43, 0x00]) + b"".join(f.data[1:] for f in frames)
 
         else:
             if len(frames) == 1:
@@ -128,8 +127,7 @@ class LegacyProtocol(Protocol):
                 message.data = frames[0].data
 
                 # add the data from the remaining frames
-                for f in frames[1:]:
-                    message.data += f.data[3:]  # loose the mode/pid/seq bytes
+                message.data += b"".join(f.data[3:] for f in frames[1:])  # loose the mode/pid/seq bytes
 
         return True
 
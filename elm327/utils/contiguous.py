@@ -7,9 +7,8 @@ def is_contiguous(l: list[int], start: int, end: int) -> bool:
     if l[-1] != end:
         return False
 
-    # for consequtiveness, look at the integers in pairs
-    pairs = zip(l, l[1:])
-    if not all([p[0] + 1 == p[1] for p in pairs]):
+    # counting up by one from start to end gives exactly one such list;
+    # the length check skips building it for the common mismatch
+    if len(l) != end - start + 1:
         return False
-
-    return True
\ No newline at end of file
+    return l == list(range(start, end + 1))
@@ -1,5 +1,7 @@
+from functools import cache
 from pathlib import Path
 
+@cache
 def get_version() -> str | None:
     """Retrieve version from pyproject.toml"""
     try:
@@ -12,17 +12,17 @@ Usage:
     python test_hardware.py --list-ports       # List available ports
 """
 
+from __future__ import annotations
+
 import sys
 import time
 from pathlib import Path
-from typing import Optional
-
-# Add parent directory to path to import obd2 module
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from typing import Optional, TYPE_CHECKING
 
-from obd2.obd_connection import OBDConnection
-from obd2.utils.obd_status import OBDStatus
-from serial.tools import list_ports
+# the OBD and serial modules are imported where they're used, so that
+# --help doesn't pay for them
+if TYPE_CHECKING:
+    from obd2.obd_connection import OBDConnection
 
 
 class Colors:
@@ -64,6 +64,8 @@ def print_test(name: str, status: str, details: str = ""):
 
 def list_available_ports():
     """List all available serial ports"""
+    from serial.tools import list_ports
+
     print_header("Available Serial Ports")
     
     ports = list(list_ports.comports())
@@ -87,6 +89,8 @@ def list_available_ports():
 
 def test_connection(port: Optional[str] = None) -> Optional[OBDConnection]:
     """Test 1: Establish connection to ELM327"""
+    from obd2.obd_connection import OBDConnection
+
     print_header("Test 1: Connection")
     
     try:
@@ -117,6 +121,8 @@ def test_connection(port: Optional[str] = None) -> Optional[OBDConnection]:
 
 def test_adapter_info(connection: OBDConnection):
     """Test 2: Get adapter information"""
+    from obd2.utils.obd_status import OBDStatus
+
     print_header("Test 2: Adapter Information")
     
     print_test("Port", "INFO", connection.port_name())
@@ -185,18 +191,31 @@ def test_basic_queries(connection: OBDConnection):
     
     successful = 0
     
+    # ask for all supported sensors together, so mode 01 PIDs
+    # can share a request
+    supported = {}
     for cmd_name, unit in queries:
+        cmd = connection.commands.get(cmd_name)
+        if not cmd:
+            print_test(cmd_name, "FAIL", "Command not found")
+        elif not connection.supports(cmd):
+            print_test(cmd_name, "WARN", "Not supported by vehicle")
+        else:
+            supported[cmd] = (cmd_name, unit)
+    
+    try:
+        responses = connection.query_batch(list(supported))
+    except Exception as e:
+        # fall back to one query per command, so each passes or fails on its own
+        print_test("Batch Query", "WARN", f"Exception: {str(e)}, querying one at a time")
+        responses = None
+    
+    for cmd, (cmd_name, unit) in supported.items():
         try:
-            cmd = connection.commands.get(cmd_name)
-            if not cmd:
-                print_test(cmd_name, "FAIL", "Command not found")
-                continue
-            
-            if not connection.supports(cmd):
-                print_test(cmd_name, "WARN", "Not supported by vehicle")
-                continue
-            
-            response = connection.query(cmd)
+            if responses is not None:
+                response = responses[cmd]
+            else:
+                response = connection.query(cmd)
             
             if response and response.value is not None:
                 print_test(cmd_name, "PASS", 
@@ -252,15 +271,22 @@ def test_continuous_monitoring(connection: OBDConnection, duration: int = 5):
     print(f"Monitoring RPM for {duration} seconds...\n")
     
     samples = []
-    start_time = time.time()
+    start_time = time.monotonic()
+    next_print = start_time
     
     try:
-        while time.time() - start_time < duration:
+        # query back to back to collect as many samples as the adapter
+        # allows, and only redraw the display every 100ms
+        while True:
+            now = time.monotonic()
+            if now - start_time >= duration:
+                break
             response = connection.query(cmd)
             if response and response.value is not None:
                 samples.append(response.value)
-                print(f"  RPM: {response.value:>6.0f}", end='\r')
-                time.sleep(0.5)
+                if now >= next_print:
+                    print(f"  RPM: {response.value:>6.0f}", end='\r')
+                    next_print = now + 0.1
         
         print()  # New line after monitoring
         
@@ -362,6 +388,9 @@ def main():
 
 
 if __name__ == "__main__":
+    # Add parent directory to path to import obd2 module
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
     try:
         main()
     except KeyboardInterrupt:
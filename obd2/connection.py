@@ -8,10 +8,12 @@ Pure OBD communication logic without GUI dependencies.
 Handles connection initialization, retry logic, and basic OBD operations.
 """
 
+import math
 import time
 import logging
 from typing import Optional, Tuple, Callable, Any
-from obd2.obd_connection import OBDConnection
+from obd2.obd_connection import OBDConnection as _OBDConnection
+from obd2.utils.obd_status import OBDStatus
 
 logger = logging.getLogger(__name__)
 
@@ -51,9 +53,10 @@ class OBDConnection:
             fast: Enable fast mode (skip some initialization)
             status_callback: Optional[Callable[[str], None]] = None for status updates
         """
-        self.connection: OBDConnection = None
+        self.connection: _OBDConnection = None
         self.ELMver = "Unknown"
         self._status_callback = status_callback
+        self._cmd_cache: dict[str, Any] = {}  # command name -> OBDCommand
         
         # Normalize parameters
         if portnum == 'AUTO':
@@ -77,7 +80,7 @@ class OBDConnection:
             
             # Attempt new connection
             try:
-                self.connection = OBDConnection(
+                self.connection = _OBDConnection(
                     portstr=portnum,
                     baudrate=baud,
                     protocol=None,
@@ -87,7 +90,7 @@ class OBDConnection:
                     start_low_power=False
                 )
                 
-                if self.connection.status() == "Car Connected":
+                if self.connection.status() == OBDStatus.CAR_CONNECTED:
                     port_name = self.connection.port_name()
                     self._notify_status(f"Connected to: {port_name}")
                     logger.info(f"OBD connection established on {port_name}")
@@ -133,7 +136,7 @@ class OBDConnection:
         """Check if currently connected to vehicle."""
         if not self.connection:
             return False
-        return self.connection.status() == "Car Connected"
+        return self.connection.status() == OBDStatus.CAR_CONNECTED
     
     def get_port_name(self) -> Optional[str]:
         """Get the name of the connected port."""
@@ -158,7 +161,7 @@ class OBDConnection:
             raise ConnectionError("Not connected to vehicle")
         
         try:
-            response = self.connection.query(OBDConnection.commands["CLEAR_DTC"])
+            response = self.connection.query(self._get_command("CLEAR_DTC"))
             logger.info("DTC codes cleared")
             return response
         except Exception as e:
@@ -182,12 +185,55 @@ class OBDConnection:
             raise ConnectionError("Not connected to vehicle")
         
         try:
-            return self.connection.query(OBDConnection.commands[command])
+            cmd = self._get_command(command)
         except KeyError:
             raise ValueError(f"Unknown OBD command: {command}")
+
+        try:
+            return self.connection.query(cmd)
         except Exception as e:
             logger.error(f"Query failed for command {command}: {e}")
             raise
+
+    def query_batch(self, commands: list[str]) -> dict[str, Any]:
+        """
+        Send several OBD commands, batching mode 01 PIDs where possible.
+        
+        Args:
+            commands: Names of the OBD commands to send
+            
+        Returns:
+            Dict of OBD response objects keyed by command name
+            
+        Raises:
+            ConnectionError: If not connected to vehicle
+        """
+        if not self.is_connected():
+            raise ConnectionError("Not connected to vehicle")
+        
+        try:
+            cmds = {name: self._get_command(name) for name in commands}
+        except KeyError as e:
+            raise ValueError(f"Unknown OBD command: {e.args[0]}")
+
+        try:
+            responses = self.connection.query_batch(list(cmds.values()))
+        except Exception as e:
+            logger.error(f"Batch query failed for commands {commands}: {e}")
+            raise
+        return {name: responses[cmd] for name, cmd in cmds.items()}
+
+    def _get_command(self, name: str) -> Any:
+        """
+        Look up an OBD command by name, remembering the result.
+
+        Raises:
+            KeyError: If there is no command with that name
+        """
+        cmd = self._cmd_cache.get(name)
+        if cmd is None:
+            cmd = self._cmd_cache[name] = _OBDConnection.commands[name]
+        return cmd
     
     def __enter__(self):
         """Context manager entry."""
@@ -214,5 +260,5 @@ def _truncate(num: float, n: int) -> float:
         >>> _truncate(3.14159, 2)
         3.14
     """
-    integer = int(num * (10 ** n)) / (10 ** n)
-    return float(integer)
+    scale = 10 ** n
+    return math.trunc(num * scale) / scale
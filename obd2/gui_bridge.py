@@ -140,13 +140,15 @@ class OBDConnectionGUI:
                 data = self.sensor(sensor_index)
                 file.write(f"Time\t{data[0].strip()}({data[2]})\n")
                 
-                # Continuous logging loop
+                # Continuous logging loop; look the methods up only once
+                sensor = self.sensor
+                write = file.write
+                flush = file.flush
                 while True:
                     now = time.time()
-                    data = self.sensor(sensor_index)
-                    line = f"{now - start_time:.6f},\t{data[1]}\n"
-                    file.write(line)
-                    file.flush()
+                    data = sensor(sensor_index)
+                    write(f"{now - start_time:.6f},\t{data[1]}\n")
+                    flush()
                     
         except KeyboardInterrupt:
             logger.info("Logging stopped by user")
@@ -2,6 +2,7 @@ from obd2.response import OBDResponse
 from obd2.command import OBDCommand
 from obd2.command_functions import commands as commands_singleton
 from elm327.elm327 import ELM327
+from elm327.protocols.models.message import Message
 from ecu.ecu_header import ECU_HEADERS
 from obd2.utils.obd_status import OBDStatus
 from serial_utils.scan_serial import *
@@ -21,6 +22,8 @@ class OBDConnection(object):
     with its assorted commands/sensors.
     """
 
+    MAX_BATCH_PIDS = 6  # the most mode 01 PIDs the ELM takes in one request
+
     def __init__(self, 
                  portstr: str, 
                  baudrate: int = None, 
@@ -310,16 +313,29 @@ class OBDConnection(object):
         self.__set_header(cmd.header)
 
         logger.info(f"Sending command: {str(cmd)}")
+        counted = self.__fast and cmd.fast and self.__frame_counts.get(cmd)
         cmd_string = self.__build_command_string(cmd)
         messages = self.__interface.send_and_parse(cmd_string)
 
+        # some adapters answer NO DATA to a command carrying a frame
+        # count; stop adding it for this command and ask again without
+        if (counted and self.__interface.is_connected()
+                and not any(m.parsed() for m in messages)):
+            logger.info("No reply with frame count, retrying without it")
+            self.__frame_counts[cmd] = None
+            cmd_string = cmd.command
+            messages = self.__interface.send_and_parse(cmd_string)
+
         if cmd_string:
             self.__last_command = cmd_string
 
         # if we don't already know how many frames this command returns,
-        # log it, so we can specify it next time
+        # log it, so we can specify it next time. Replies like NO DATA
+        # aren't frames, and the ELM takes a single hex digit, so only
+        # 1 to 15 frames can be announced
         if cmd not in self.__frame_counts:
-            self.__frame_counts[cmd] = sum([len(m.frames) for m in messages])
+            frames = sum(len(m.frames) for m in messages if m.parsed())
+            self.__frame_counts[cmd] = frames if 0 < frames <= 0xF else None
 
         if not messages:
             logger.info("No valid OBD Messages returned")
@@ -334,8 +350,8 @@ class OBDConnection(object):
         # if we know the number of frames that this command returns,
         # only wait for exactly that number. This avoids some harsh
         # timeouts from the ELM, thus speeding up queries.
-        if self.__fast and cmd.fast and (cmd in self.__frame_counts):
-            cmd_string += str(self.__frame_counts[cmd]).encode()
+        if self.__fast and cmd.fast and self.__frame_counts.get(cmd):
+            cmd_string += b"%X" % self.__frame_counts[cmd]
 
         # if we sent this last time, just send a CR
         # (CR is added by the ELM327 class)
@@ -343,3 +359,68 @@ class OBDConnection(object):
             cmd_string = b""
 
         return cmd_string
+
+    def query_batch(self, cmds: list[OBDCommand]) -> dict[OBDCommand, OBDResponse]:
+        """
+            Queries several commands at once. Over CAN, supported mode 01
+            PIDs are asked for up to six per request, and the ELM returns
+            all of their values in one reply. Everything else goes through
+            query() one at a time.
+
+            Returns a dict of OBDResponses keyed by command
+        """
+        if self.status() == OBDStatus.NOT_CONNECTED:
+            logger.warning("Query failed, no connection available")
+            return {cmd: OBDResponse() for cmd in cmds}
+
+        responses = {}
+        can = self.__interface.protocol_id in ["6", "7", "8", "9"]
+
+        batchable = []
+        for cmd in dict.fromkeys(cmds):
+            if (can and cmd.mode == 1 and cmd.bytes > 2
+                    and cmd.header == ECU_HEADERS.ENGINE
+                    and self.test_cmd(cmd, warn=False)):
+                batchable.append(cmd)
+            else:
+                responses[cmd] = self.query(cmd)
+
+        for i in range(0, len(batchable), self.MAX_BATCH_PIDS):
+            responses.update(self.__query_pids(batchable[i:i + self.MAX_BATCH_PIDS]))
+
+        return {cmd: responses[cmd] for cmd in cmds}
+
+    def __query_pids(self, cmds):
+        """ sends one multi-PID mode 01 request, and splits the reply """
+        self.__set_header(ECU_HEADERS.ENGINE)
+
+        cmd_string = b"01" + b"".join(cmd.command[2:] for cmd in cmds)
+        logger.info(f"Sending command: {cmd_string}")
+        messages = self.__interface.send_and_parse(cmd_string)
+        self.__last_command = cmd_string
+
+        # each ECU answers with one message: the 0x41 mode byte, followed
+        # by every PID it supports along with that PID's data bytes
+        by_pid = {cmd.pid: cmd for cmd in cmds}
+        split = {cmd: [] for cmd in cmds}
+        for m in messages:
+            data = m.data
+            if data[:1] != b"\x41":
+                continue
+            i = 1
+            while i < len(data) and data[i] in by_pid:
+                cmd = by_pid[data[i]]
+                end = i + cmd.bytes - 1
+                if end > len(data):
+                    break
+                split[cmd].append(Message(m.frames, m.ecu, data=bytearray(b"\x41") + data[i:end], can=m.can))
+                i = end
+
+        responses = {}
+        for cmd, cmd_messages in split.items():
+            if cmd_messages:
+                responses[cmd] = cmd(cmd_messages)
+            else:
+                logger.info("No valid OBD Messages returned for %s", cmd.name)
+                responses[cmd] = OBDResponse()
+        return responses
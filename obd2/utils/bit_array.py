@@ -1,4 +1,5 @@
 from bitarray import bitarray
+from bitarray.util import ba2int
 
 
 class BitArray:
@@ -24,7 +25,7 @@ class BitArray:
         bits_slice = self.bits[start:stop]
         if len(bits_slice) == 0:
             return 0
-        return int(bits_slice.to01(), 2)
+        return ba2int(bits_slice)
 
     def __getitem__(self, key):
         result = self.bits[key]
@@ -37,8 +38,9 @@ class BitArray:
         return len(self.bits)
 
     def __str__(self):
-        return self.bits
+        return self.bits.to01()
 
     def __iter__(self):
-        return [b == "1" for b in self.bits].__iter__()
+        # bitarray yields 0/1 ints (as does indexing), iterate as bools
+        return map(bool, self.bits)
 
@@ -162,7 +162,7 @@ UAS_IDS = {
     0x3B: UAS(False, 0.0001, Unit.gram),                # Mass (0.0001 g resolution)
     
     # Boolean/status indicator
-    0x2E: lambda _bytes: any([bool(x) for x in _bytes]),  # Any byte non-zero = True
+    0x2E: lambda _bytes: any(_bytes),  # Any byte non-zero = True
     
     # Percentage measurements
     0x2F: UAS(False, 0.01, Unit.percent),               # Percentage (0.01% resolution)
@@ -139,7 +139,12 @@ class MockSerial:
         result = bytes(self._read_buffer[:size])
         self._read_buffer = self._read_buffer[size:]
         return result
-    
+
+    @property
+    def in_waiting(self) -> int:
+        """Number of bytes ready to be read"""
+        return len(self._read_buffer)
+
     def readline(self) -> bytes:
         """Read a line from the buffer"""
         line = b''
@@ -161,6 +166,10 @@ class MockSerial:
     def flushInput(self):
         """Clear input buffer"""
         self._read_buffer = []
+
+    def reset_input_buffer(self):
+        """Clear input buffer"""
+        self._read_buffer = []
     
     def flushOutput(self):
         """Clear output buffer (no-op for mock)"""
@@ -142,5 +142,132 @@ class TestOBDPowerModes:
         assert connection is not None
 
 
+@pytest.mark.connection
+class TestOBDLoadCommands:
+    """Test supported commands are loaded from the PID bitmaps"""
+
+    @patch('time.sleep')
+    @patch('elm327.elm327.serial.serial_for_url')
+    def test_load_commands_marks_bitmap_pids_new(self, mock_serial_for_url, mock_sleep, mock_serial):
+        """Test PIDs set in the 0100 and 0120 bitmaps are marked as supported"""
+        mock_serial_for_url.return_value = mock_serial
+        mock_serial.set_response(b"ATDPN\r", ["A6"])
+        # 0x0C, 0x0D and 0x20 set, 0x0A clear
+        mock_serial.set_response(b"0100\r", ["7E8 06 41 00 BE 3F B8 13"])
+        # 0x21 and 0x40 set
+        mock_serial.set_response(b"0120\r", ["7E8 06 41 20 80 00 00 01"])
+
+        connection = OBDConnection(portstr='/dev/ttyUSB0', baudrate=38400,
+                                   fast=False, check_voltage=False)
+        commands = OBDConnection.commands
+
+        assert connection.supports(commands.RPM)
+        assert connection.supports(commands.SPEED)
+        assert connection.supports(commands.PIDS_B)
+        assert connection.supports(commands.DISTANCE_W_MIL)
+        assert connection.supports(commands.PIDS_C)
+        assert not connection.supports(commands.FUEL_PRESSURE)
+
+
+@pytest.mark.connection
+class TestOBDFastMode:
+    """Test fast mode frame count suffixes"""
+
+    def _connect(self, mock_serial, fast=True):
+        mock_serial.set_response(b"ATDPN\r", ["A6"])
+        mock_serial.set_response(b"0100\r", ["7E8 06 41 00 BE 3F B8 13"])
+        mock_serial.set_response(b"010C\r", ["7E8 04 41 0C 1A F8"])
+        with patch('elm327.elm327.serial.serial_for_url', return_value=mock_serial), \
+                patch('time.sleep'):
+            connection = OBDConnection(portstr='/dev/ttyUSB0', baudrate=38400,
+                                       fast=fast, check_voltage=False)
+        assert connection.status() == OBDStatus.CAR_CONNECTED
+        return connection
+
+    def test_frame_count_suffix_new(self, mock_serial):
+        """Test repeated queries announce the frame count seen the first time"""
+        connection = self._connect(mock_serial)
+        mock_serial.set_response(b"010C1\r", ["7E8 04 41 0C 1A F8"])
+
+        with patch.object(mock_serial, 'write', wraps=mock_serial.write) as write:
+            connection.query(OBDConnection.commands.RPM)
+            response = connection.query(OBDConnection.commands.RPM)
+
+        assert [c.args[0] for c in write.call_args_list] == [b"010C\r", b"010C1\r"]
+        assert response.value.magnitude == 1726
+
+    def test_frame_count_suffix_fallback_new(self, mock_serial):
+        """Test a NO DATA reply to a suffixed command retries without the count"""
+        connection = self._connect(mock_serial)
+
+        with patch.object(mock_serial, 'write', wraps=mock_serial.write) as write:
+            connection.query(OBDConnection.commands.RPM)
+            response = connection.query(OBDConnection.commands.RPM)
+            connection.query(OBDConnection.commands.RPM)
+
+        assert [c.args[0] for c in write.call_args_list] == [
+            b"010C\r", b"010C1\r", b"010C\r", b"\r"]
+        assert response.value.magnitude == 1726
+
+    def test_no_frame_count_no_retry_new(self, mock_serial):
+        """Test a NO DATA reply isn't retried when no frame count was sent"""
+        connection = self._connect(mock_serial, fast=False)
+        connection.query(OBDConnection.commands.RPM)
+        mock_serial.set_response(b"010C\r", ["NO DATA"])
+
+        with patch.object(mock_serial, 'write', wraps=mock_serial.write) as write:
+            response = connection.query(OBDConnection.commands.RPM)
+
+        assert [c.args[0] for c in write.call_args_list] == [b"010C\r"]
+        assert response.value is None
+
+    def test_query_batch_new(self, mock_serial):
+        """Test query_batch asks for mode 01 PIDs together and splits the reply"""
+        connection = self._connect(mock_serial)
+        mock_serial.set_response(b"010C0D05\r", [
+            "7E8 10 08 41 0C 1A F8 0D 3C\r7E8 21 05 5F 00 00 00 00 00"])
+        commands = OBDConnection.commands
+
+        with patch.object(mock_serial, 'write', wraps=mock_serial.write) as write:
+            responses = connection.query_batch(
+                [commands.RPM, commands.SPEED, commands.COOLANT_TEMP, commands.ELM_VOLTAGE])
+
+        assert [c.args[0] for c in write.call_args_list] == [b"ATRV\r", b"010C0D05\r"]
+        assert responses[commands.RPM].value.magnitude == 1726
+        assert responses[commands.SPEED].value.magnitude == 60
+        assert responses[commands.COOLANT_TEMP].value.magnitude == 55
+        assert responses[commands.ELM_VOLTAGE].value.magnitude == 12.6
+
+
+@pytest.mark.connection
+class TestConnectionWrapper:
+    """Test the GUI-independent wrapper in obd2.connection"""
+
+    @patch('obd2.connection._OBDConnection')
+    def test_query_command_by_name(self, mock_obd_connection):
+        """Test query_command resolves command names against the command table"""
+        from obd2.connection import OBDConnection as ConnectionWrapper
+        mock_obd_connection.commands = OBDConnection.commands
+        mock_obd_connection.return_value.status.return_value = OBDStatus.CAR_CONNECTED
+
+        wrapper = ConnectionWrapper(portnum='/dev/ttyUSB0', reconnect_attempts=1)
+        wrapper.query_command("RPM")
+        wrapper.query_command("RPM")
+
+        query = mock_obd_connection.return_value.query
+        assert query.call_args_list == [((OBDConnection.commands.RPM,),)] * 2
+
+    @patch('obd2.connection._OBDConnection')
+    def test_query_command_unknown_name(self, mock_obd_connection):
+        """Test query_command rejects names that aren't commands"""
+        from obd2.connection import OBDConnection as ConnectionWrapper
+        mock_obd_connection.commands = OBDConnection.commands
+        mock_obd_connection.return_value.status.return_value = OBDStatus.CAR_CONNECTED
+
+        wrapper = ConnectionWrapper(portnum='/dev/ttyUSB0', reconnect_attempts=1)
+        with pytest.raises(ValueError):
+            wrapper.query_command("NOT_A_COMMAND")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
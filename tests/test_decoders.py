@@ -49,6 +49,18 @@ class TestBasicDecoders:
         assert isinstance(result, str)
         assert len(result) > 0
 
+    def test_encoded_string_keeps_ascii_digits(self):
+        """Test only ELM padding is stripped from encoded strings"""
+        # 49 02 | 00 00 01 "1HGCM82633A004102"
+
+        class MockMessage:
+            def __init__(self):
+                self.data = bytearray(b'\x49\x02\x00\x00\x011HGCM82633A004102')
+
+        result = decoders.decode_encoded_string([MockMessage()], 17)
+
+        assert result == b'1HGCM82633A004102'
+
 
 @pytest.mark.decoders
 class TestTemperatureDecoders:
@@ -333,6 +345,11 @@ class TestDTCDecoders:
         if result:
             code, description = result
             assert code == "C0561"
+
+    def test_parse_dtc_hex_digits_and_padding(self):
+        """Test parse_dtc() uppercases hex digits and drops 00 00 padding"""
+        assert decoders.parse_dtc([0xC1, 0xAB])[0] == "U01AB"
+        assert decoders.parse_dtc(memoryview(b"\x00\x00")) is None
     
     def test_dtc_decoder_multiple(self):
         """Test decoding multiple DTCs from response"""
@@ -363,6 +380,18 @@ class TestDTCDecoders:
         assert "P0202" in codes  # Injector Circuit/Open - Cylinder 2
         assert "P0103" in codes  # Mass or Volume Air Flow Circuit High Input
 
+    def test_dtc_decoder_no_codes(self):
+        """Test an all-padding response decodes to no DTCs"""
+        # Response: 43 00 00 00 00 00 00 (non-CAN, no codes stored)
+
+        class MockMessage:
+            def __init__(self):
+                self.data = bytearray([0x43, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00])
+                self.can = False
+                self.num_frames = 1
+
+        assert decoders.dtc([MockMessage()]) == []
+
 
 @pytest.mark.decoders
 class TestStatusDecoders:
@@ -421,6 +450,21 @@ class TestStatusDecoders:
             assert isinstance(result, tuple)
             assert len(result) == 2
 
+    def test_o2_sensors_banks(self):
+        """Test O2 sensor presence decoders return per-bank tuples of bools"""
+        # 41 13 A3: 10100011
+
+        class MockMessage:
+            def __init__(self):
+                self.data = bytearray([0x41, 0x13, 0xA3])
+
+        result = decoders.o2_sensors([MockMessage()])
+        assert result == ((), (True, False, True, False), (False, False, True, True))
+        assert all(type(bit) is bool for bit in result[1] + result[2])
+
+        result = decoders.o2_sensors_alt([MockMessage()])
+        assert result == ((), (True, False), (True, False), (False, False), (True, True))
+
 
 @pytest.mark.decoders
 class TestVoltageDecoders:
@@ -491,5 +535,79 @@ class TestCountDecoders:
         assert abs(count_value - 100.0) < 0.1
 
 
+@pytest.mark.decoders
+class TestBatchDecoders:
+    """Test vectorized decoding of many responses at once"""
+
+    @staticmethod
+    def _messages(*payloads):
+        class MockMessage:
+            def __init__(self, data):
+                self.data = bytearray(data)
+
+        return [MockMessage(p) for p in payloads]
+
+    def test_percent_batch_matches_scalar(self):
+        """Test decode_batch() agrees with the single-message decoder"""
+        messages = self._messages([0x41, 0x04, 0x00], [0x41, 0x04, 0x80], [0x41, 0x04, 0xFF])
+
+        result = decoders.decode_batch(decoders.percent, messages)
+
+        assert len(result) == 3
+        for i, message in enumerate(messages):
+            expected = decoders.percent([message]).magnitude
+            assert abs(result.magnitude[i] - expected) < 1e-9
+
+    def test_two_byte_batch(self):
+        """Test decode_batch() on a multi-byte value"""
+        # 0x0100 = 256 -> 256 * 100/255 %
+        messages = self._messages([0x41, 0x43, 0x01, 0x00], [0x41, 0x43, 0x00, 0xFF])
+
+        result = decoders.decode_batch(decoders.absolute_load, messages)
+
+        assert abs(result.magnitude[0] - 256 * 100.0 / 255.0) < 1e-9
+        assert abs(result.magnitude[1] - 100.0) < 1e-9
+
+    def test_temp_batch(self):
+        """Test decode_batch() keeps the non-multiplicative temperature unit"""
+        messages = self._messages([0x41, 0x05, 0x5F], [0x41, 0x05, 0x14])
+
+        result = decoders.decode_batch(decoders.temp, messages)
+
+        assert list(result.magnitude) == [55, -20]
+        assert str(result.units) == "degree_Celsius"
+
+    def test_unsupported_decoder(self):
+        """Test decode_batch() rejects decoders without a batch form"""
+        with pytest.raises(ValueError):
+            decoders.decode_batch(decoders.status, self._messages([0x41, 0x01, 0, 0, 0, 0]))
+
+
+@pytest.mark.decoders
+class TestMonitorDecoders:
+    """Test Mode 06 monitor decoders"""
+
+    def test_monitor_two_tests(self):
+        """Test monitor() splits the data into 9-byte test records"""
+        # 46 | 01 01 0A 00 64 00 32 00 C8 | 01 0B 24 00 03 00 00 00 05
+        # TID 0x01, UAS 0x0A (0.122 mV): value 100, min 50, max 200
+        # TID 0x0B, UAS 0x24 (count):    value 3,   min 0,  max 5
+
+        class MockMessage:
+            def __init__(self):
+                self.data = bytearray([0x46,
+                                       0x01, 0x01, 0x0A, 0x00, 0x64, 0x00, 0x32, 0x00, 0xC8,
+                                       0x01, 0x0B, 0x24, 0x00, 0x03, 0x00, 0x00, 0x00, 0x05])
+
+        result = decoders.monitor([MockMessage()])
+
+        assert len(result) == 2
+        assert result.RTL_THRESHOLD_VOLTAGE.tid == 0x01
+        assert abs(result[0x01].value.magnitude - 100 * 0.122) < 1e-6
+        assert result[0x01].passed
+        assert result.MISFIRE_AVERAGE.value.magnitude == 3
+        assert result.MISFIRE_AVERAGE.max.magnitude == 5
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
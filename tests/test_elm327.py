@@ -7,7 +7,7 @@ communication methods.
 """
 
 import pytest
-from unittest.mock import Mock, MagicMock, patch, call
+from unittest.mock import Mock, MagicMock, PropertyMock, patch, call
 import serial
 
 from elm327.elm327 import ELM327, detect_elm327_baudrate
@@ -40,6 +40,25 @@ class TestELM327Initialization:
         assert elm.status == OBDStatus.CAR_CONNECTED
         assert mock_port.write.call_count >= 4  # At least ATZ, ATE0, ATH1, ATL0
         
+    def test_init_low_latency_not_supported(self, mock_serial_class):
+        """Test initialization carries on when the port has no low latency mode"""
+        mock_port = mock_serial_class.return_value
+        mock_port.set_low_latency_mode.side_effect = ValueError("not a tty")
+        mock_port.read.side_effect = [
+            b'ELM327 v1.5>',  # ATZ response
+            b'ATE0\rOK>',     # ATE0 response
+            b'OK>',           # ATH1 response
+            b'OK>',           # ATL0 response
+            b'OK>',           # ATSP0 response
+            b'41 00 BE 3E B8 13>',  # 0100 response
+            b'A6>',           # ATDPN response
+        ]
+
+        elm = ELM327(portname='/dev/ttyUSB0', baudrate=38400, protocol=None, timeout=10)
+
+        mock_port.set_low_latency_mode.assert_called_once_with(True)
+        assert elm.status == OBDStatus.CAR_CONNECTED
+
     def test_init_baudrate_failure(self, mock_serial_class):
         """Test initialization fails when baudrate cannot be set"""
         mock_port = mock_serial_class.return_value
@@ -125,6 +144,27 @@ class TestELM327Initialization:
             
             assert elm.status == OBDStatus.CAR_CONNECTED
     
+    def test_init_with_voltage_check_reads_voltage(self, mock_serial_class):
+        """Test initialization runs the real voltage check"""
+        mock_port = mock_serial_class.return_value
+        mock_port.portstr = '/dev/ttyUSB0'
+        mock_port.baudrate = 38400
+        mock_port.read.side_effect = [
+            b'ELM327 v1.5>',  # ATZ response
+            b'ATE0\rOK>',     # ATE0 response
+            b'OK>',           # ATH1 response
+            b'OK>',           # ATL0 response
+            b'12.6V>',        # AT RV response
+            b'OK>',           # ATSP0 response
+            b'41 00 BE 3E B8 13>',  # 0100 response
+            b'A6>',           # ATDPN response
+        ]
+
+        elm = ELM327(portname='/dev/ttyUSB0', baudrate=38400, protocol=None,
+                     timeout=10, check_voltage=True)
+
+        assert elm.status == OBDStatus.CAR_CONNECTED
+
     def test_init_with_voltage_check_low_voltage(self, mock_serial_class):
         """Test initialization fails when voltage is too low"""
         mock_port = mock_serial_class.return_value
@@ -180,7 +220,29 @@ class TestELM327Initialization:
         
         # Should send space character to wake up
         assert any(b' ' in call[0][0] for call in mock_port.write.call_args_list)
-    
+
+    def test_init_with_start_low_power_waits_for_prompt(self, mock_serial_class):
+        """Test waking waits for the prompt, within the wake timeout"""
+        mock_port = mock_serial_class.return_value
+        mock_port.portstr = '/dev/ttyUSB0'
+        mock_port.baudrate = 38400
+        mock_port.timeout = 10
+        timeouts = []
+        mock_port.read_until.side_effect = lambda expected: (
+            timeouts.append(mock_port.timeout) or b'\r\rELM327 v1.5\r\r>')
+        mock_port.read.side_effect = [
+            b'ELM327 v1.5>', b'ATE0\rOK>', b'OK>', b'OK>', b'OK>',
+            b'41 00 BE 3E B8 13>', b'A6>',
+        ]
+
+        elm = ELM327(portname='/dev/ttyUSB0', baudrate=38400, protocol=None,
+                     timeout=10, start_low_power=True)
+
+        mock_port.read_until.assert_called_once_with(ELM327.ELM_PROMPT)
+        assert timeouts == [ELM327._WAKE_TIMEOUT]
+        assert mock_port.timeout == 10
+        assert elm.status == OBDStatus.CAR_CONNECTED
+
     def test_init_protocol_set_failure(self, mock_serial_class):
         """Test initialization when protocol cannot be set"""
         mock_port = mock_serial_class.return_value
@@ -261,6 +323,18 @@ class TestELM327ProtocolMethods:
         result = elm.auto_protocol()
         assert result == True
     
+    def test_auto_protocol_automatic_prefix(self, mock_serial_class, initialized_elm):
+        """Test the "A" prefix of ATDPN is dropped, but a lone "A" is kept"""
+        elm = initialized_elm
+        elm._ELM327__port.read.side_effect = [
+            b'OK>',                  # ATSP0 response
+            b'41 00 BE 3E B8 13>',   # 0100 response
+            b'AA>',                  # ATDPN returns protocol A (automatic)
+        ]
+
+        assert elm.auto_protocol() == True
+        assert elm.protocol_id == "A"
+
     def test_auto_protocol_fallback_to_manual(self, mock_serial_class, initialized_elm):
         """Test auto_protocol falls back to trying protocols manually"""
         elm = initialized_elm
@@ -356,6 +430,58 @@ class TestELM327BaudrateMethods:
         result = detect_elm327_baudrate(mock_port)
         assert result == ELM327._TRY_BAUDS[0]  # First baudrate
     
+    def test_detect_elm327_baudrate_stops_at_prompt(self, mock_serial_class):
+        """Test the probe reply is not read past the prompt"""
+        mock_port = mock_serial_class.return_value
+        mock_port.timeout = 10
+        mock_port.read.side_effect = [b'ELM327', b' v1.5>']
+
+        result = detect_elm327_baudrate(mock_port)
+        assert result == ELM327._TRY_BAUDS[0]
+        assert mock_port.read.call_count == 2
+
+    def test_detect_elm327_baudrate_first_try(self, mock_serial_class):
+        """Test the given baudrate is probed before the usual order"""
+        mock_port = mock_serial_class.return_value
+        mock_port.timeout = 10
+        mock_port.read.return_value = b'ELM327 v1.5>'
+
+        result = detect_elm327_baudrate(mock_port, first_try=115200)
+        assert result == 115200
+
+    def test_auto_detect_baudrate_remembers_last(self, mock_serial_class, initialized_elm):
+        """Test a second detection starts with the baudrate found before"""
+        elm = initialized_elm
+        elm._ELM327__port.read.side_effect = [b'', b'ELM327 v1.5>']
+        assert elm.auto_detect_baudrate() == ELM327._TRY_BAUDS[1]
+
+        elm._ELM327__port.read.side_effect = [b'ELM327 v1.5>']
+        assert elm.auto_detect_baudrate() == ELM327._TRY_BAUDS[1]
+
+    def test_detect_elm327_baudrate_skips_unsupported(self, mock_serial_class):
+        """Test a baudrate the port refused is not tried again"""
+        mock_port = mock_serial_class.return_value
+        mock_port.timeout = 10
+        mock_port.read.return_value = b''
+        refused = ELM327._TRY_BAUDS[-1]
+
+        def set_baudrate(*args):
+            if args and args[0] == refused:
+                raise serial.SerialException("unsupported")
+        baudrate = PropertyMock(side_effect=set_baudrate)
+        type(mock_port).baudrate = baudrate
+
+        unsupported = set()
+        detect_elm327_baudrate(mock_port, unsupported=unsupported)
+        detect_elm327_baudrate(mock_port, unsupported=unsupported)
+
+        assert unsupported == {refused}
+        assert baudrate.call_args_list.count(call(refused)) == 1
+
+    def test_try_bauds_probed_once(self):
+        """Test no baudrate is probed twice during detection"""
+        assert len(ELM327._TRY_BAUDS) == len(set(ELM327._TRY_BAUDS))
+
     def test_detect_elm327_baudrate_all_fail(self, mock_serial_class):
         """Test detect_elm327_baudrate when no baudrate works"""
         mock_port = mock_serial_class.return_value
@@ -399,6 +525,21 @@ class TestELM327Communication:
         assert any(b' ' in call[0][0] for call in elm._ELM327__port.write.call_args_list)
 
 
+    def test_check_voltage(self, initialized_elm):
+        """Test check_voltage parses the AT RV reply"""
+        elm = initialized_elm
+        elm._ELM327__port.read.return_value = b'12.6V>'
+
+        assert elm.check_voltage() == 12.6
+
+    def test_check_voltage_bad_reply(self, initialized_elm):
+        """Test check_voltage returns None for an unparseable AT RV reply"""
+        elm = initialized_elm
+        elm._ELM327__port.read.return_value = b'?>'
+
+        assert elm.check_voltage() is None
+
+
 class TestELM327PowerManagement:
     """Test power management methods"""
     
@@ -411,6 +552,16 @@ class TestELM327PowerManagement:
         result = elm.low_power()
         assert 'OK' in result
     
+    def test_low_power_marker_split_across_reads(self, initialized_elm):
+        """Test the end marker is found when it arrives in two reads"""
+        elm = initialized_elm
+        elm._ELM327__status = OBDStatus.CAR_CONNECTED
+        elm._ELM327__port.read.side_effect = [b'O', b'K']
+
+        result = elm.low_power()
+        assert result == ['OK']
+        assert elm._ELM327__port.read.call_count == 2
+
     def test_low_power_when_not_connected(self, initialized_elm):
         """Test low_power returns None when not connected"""
         elm = initialized_elm
@@ -423,7 +574,7 @@ class TestELM327PowerManagement:
         """Test exiting low power mode"""
         elm = initialized_elm
         elm._ELM327__status = OBDStatus.CAR_CONNECTED
-        elm._ELM327__low_power = True
+        elm._ELM327__low_power_mode = True
         elm._ELM327__port.read.return_value = b'>'
         
         result = elm.normal_power()
@@ -33,6 +33,18 @@ class TestProtocolClasses:
         assert hasattr(message, 'frames')
         assert hasattr(message, 'data')
 
+    def test_message_ecu_per_instance_new(self):
+        """Test Message.ecu defaults to UNKNOWN and is set per message (new)"""
+        from elm327.protocols.models.message import Message
+        from elm327.protocols.models.frame import Frame
+        from ecu.ecu import ECU
+
+        message = Message([Frame("41 0C 1A F8")])
+        other = Message([Frame("41 0C 1A F8")])
+        message.ecu = ECU.ENGINE
+        assert message.ecu == ECU.ENGINE
+        assert other.ecu == ECU.UNKNOWN
+
 
 @pytest.mark.protocols
 class TestECUConstants:
@@ -99,6 +99,16 @@ class TestBitArray:
         value = ba.value(0, 4)  # First 4 bits = 0b1111 = 15
         assert value == 15
 
+    def test_bitarray_iter_new(self):
+        """Test iterating a BitArray yields each bit, MSB first"""
+        from obd2.utils.bit_array import BitArray
+
+        # 0xA0 = 10100000
+        ba = BitArray(bytearray([0xA0]))
+
+        assert list(ba) == [True, False, True, False, False, False, False, False]
+        assert str(ba) == "10100000"
+
 
 @pytest.mark.utils
 class TestOBDStatus:
@@ -132,6 +142,7 @@ class TestContiguous:
         assert is_contiguous([1, 3, 4], 1, 4) == False  # Gap at 2
         assert is_contiguous([2, 3, 4], 1, 4) == False  # Wrong start
         assert is_contiguous([1, 2, 3], 1, 4) == False  # Wrong end
+        assert is_contiguous([1, 1, 4, 4], 1, 4) == False  # Right length and sum
     
     def test_contiguous_empty_new(self):
         """Test contiguous check with empty list (new)"""